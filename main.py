@@ -6,10 +6,11 @@ import random
 import time
 import json
 import colorsys
+import functools
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 import pygame
 
@@ -75,6 +76,13 @@ class Scene:
     def draw(self, surface):
         pass
 
+    def frame_key(self):
+        """Hashable summary of what draw would paint, or None to always redraw.
+
+        Game.run skips draw and flip while this stays equal and no events arrive.
+        """
+        return None
+
 
 class InputState:
     def __init__(self):
@@ -95,6 +103,12 @@ class InputState:
         self.vertical_axis = 0.0
 
 
+@functools.lru_cache(maxsize=16)
+def _menu_fallback_font(size: int) -> pygame.font.Font:
+    # SysFont walks the system font list, so never call it per frame
+    return pygame.font.SysFont("consolas", size, bold=True)
+
+
 class VerticalMenu:
     def __init__(self, *args, **kwargs):
         self.entries = args[0] if args and isinstance(args[0], list) else []
@@ -177,9 +191,7 @@ class VerticalMenu:
             font_size = min_font
             spacing_mult = getattr(self, "spacing_multiplier", 1.0)
             spacing = int(font_size * 1.6 * spacing_mult)
-        font = assets.font(font_size, True) if assets and hasattr(assets, "font") else pygame.font.SysFont(
-            "consolas", font_size, bold=True
-        )
+        font = assets.font(font_size, True) if assets and hasattr(assets, "font") else _menu_fallback_font(font_size)
         menu_width = int(surface.get_width() * 0.34)
         menu_x = (surface.get_width() - menu_width) // 2
         logo_bottom = int(surface.get_height() * 0.23) + 100
@@ -334,6 +346,35 @@ def draw_center_text(surface, font, text, y, color, *args, **kwargs):
     surface.blit(rendered, rect)
 
 
+@functools.lru_cache(maxsize=512)
+def _render_text_cached(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    # Assets.font hands out one Font per (size, bold), so the font object is a
+    # stable key. Call _render_text_cached.cache_clear() if fonts are reloaded.
+    rendered = font.render(text, True, color)
+    return rendered.convert_alpha() if pygame.display.get_surface() else rendered
+
+
+@functools.lru_cache(maxsize=256)
+def _center_text_blits(width: int, font, text, y, color) -> Tuple[Tuple[pygame.Surface, Tuple[int, int]], ...]:
+    """The (shadow, text) blits draw_center_text would make on a surface this wide.
+
+    Positions are topleft tuples rather than Rects, so the shared cached entries
+    can't be moved by a caller.
+    """
+    shadow = _render_text_cached(font, text, (0, 0, 0))
+    rendered = _render_text_cached(font, text, color)
+    cx = width // 2
+    return (
+        (shadow, shadow.get_rect(center=(cx, y + 3)).topleft),
+        (rendered, rendered.get_rect(center=(cx, y)).topleft),
+    )
+
+
+def _draw_center_text_cached(surface, font, text, y, color) -> None:
+    """draw_center_text for labels that repeat frame to frame."""
+    surface.blits(_center_text_blits(surface.get_width(), font, text, y, color), doreturn=False)
+
+
 def draw_glitch_text(surface, font, text, y, color, glitch_fx=False, *args, **kwargs):
     if glitch_fx:
         import random
@@ -1208,9 +1249,14 @@ class ProgressManager:
         self.coins = 0
         self.skills: Dict[str, Any] = DEFAULT_SETTINGS["skills"].copy()
         self.cosmetics: Dict[str, Any] = DEFAULT_COSMETICS.copy()
+        # perf_counter() of the oldest unwritten deferred save, or None when clean
+        self._dirty_since: Optional[float] = None
         self.load()
 
     def load(self) -> None:
+        # A pending deferred save is newer than the file; write it before re-reading
+        if self._dirty_since is not None:
+            self.flush()
         if not self.path.exists():
             return
         try:
@@ -1267,7 +1313,8 @@ class ProgressManager:
             self.player_color = None
             self.coins = 0
 
-    def save(self, world: int, level: int, player_color: Optional[Tuple[int, int, int]] = None, coins: Optional[int] = None, skills: Optional[Dict[str, Any]] = None, cosmetics: Optional[Dict[str, Any]] = None) -> None:
+    def save(self, world: int, level: int, player_color: Optional[Tuple[int, int, int]] = None, coins: Optional[int] = None, skills: Optional[Dict[str, Any]] = None, cosmetics: Optional[Dict[str, Any]] = None, defer: bool = False) -> None:
+        """Update progress and write it out; with defer=True the write waits for flush()."""
         self.world, self.level = world, level
         if coins is not None:
             self.coins = int(coins)
@@ -1280,6 +1327,20 @@ class ProgressManager:
                 self.player_color = (int(player_color[0]), int(player_color[1]), int(player_color[2]))
             except Exception:
                 self.player_color = None
+        if defer:
+            # Shop purchases come in bursts; Game.run flushes shortly after
+            if self._dirty_since is None:
+                self._dirty_since = time.perf_counter()
+            return
+        self._write()
+
+    def flush(self, min_age: float = 0.0) -> None:
+        """Write a pending deferred save once it is at least min_age seconds old."""
+        if self._dirty_since is not None and time.perf_counter() - self._dirty_since >= min_age:
+            self._write()
+
+    def _write(self) -> None:
+        self._dirty_since = None
         payload: Dict[str, Any] = {"world": self.world, "level": self.level, "coins": self.coins}
         payload["skills"] = self.skills
         payload["cosmetics"] = self.cosmetics
@@ -1294,7 +1355,10 @@ class ProgressManager:
             if selected_form is not None:
                 payload["form"] = selected_form
         try:
-            self.path.write_text(json.dumps(payload))
+            # Write beside the save and swap it in, so a crash mid-write can't truncate it
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text(json.dumps(payload))
+            tmp_path.replace(self.path)
         except Exception as exc:
             print(f"[Save] Failed to write save file: {exc}")
 
@@ -1980,6 +2044,39 @@ def generate_color_wheel(radius: int = COLOR_WHEEL_RADIUS) -> pygame.Surface:
     return surface
 
 
+@functools.lru_cache(maxsize=4)
+def _cached_color_wheel(radius: int = COLOR_WHEEL_RADIUS) -> pygame.Surface:
+    # The wheel is a pure function of its radius and is only ever sampled, so
+    # every scene can share one copy instead of re-plotting it per pixel
+    return generate_color_wheel(radius).convert_alpha()
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_color_wheel_rgb(radius: int = COLOR_WHEEL_RADIUS) -> np.ndarray:
+    # A copied (x, y, rgb) array: indexing it needs no surface lock, and unlike
+    # a pixels3d view it doesn't keep the shared wheel locked against blits
+    rgb = pygame.surfarray.array3d(_cached_color_wheel(radius))
+    rgb.flags.writeable = False
+    return rgb
+
+
+@functools.lru_cache(maxsize=1024)
+def _color_to_hsv(color: Tuple[int, int, int]) -> Tuple[float, float, float]:
+    r, g, b = color
+    return colorsys.rgb_to_hsv(r / 255.0, g / 255.0, b / 255.0)
+
+
+@functools.lru_cache(maxsize=1024)
+def _wheel_pos_for_color(color: Tuple[int, int, int], left: int, top: int,
+                         radius: int = COLOR_WHEEL_RADIUS) -> Tuple[int, int]:
+    # Drags and nudges keep landing on the same handful of colours
+    h, s, _ = _color_to_hsv(color)
+    angle = h * math.tau
+    distance = min(1.0, max(0.0, s)) * radius
+    return (left + radius + int(math.cos(angle) * distance),
+            top + radius - int(math.sin(angle) * distance))
+
+
 def apply_dynamic_glitch(surface: pygame.Surface, strength: float) -> None:
     strength = max(0.2, min(strength, 2.0))
     tear_count = max(3, int(4 * strength))
@@ -2630,6 +2727,9 @@ class Player(pygame.sprite.Sprite):
 
 
 class Platform(pygame.sprite.Sprite):
+    # True for platforms whose motion is driven from an _anchor position
+    HAS_ANCHOR = False
+
     def __init__(self, x, y, width=64, height=16, world_num=None, asset_cache=None, *args, **kwargs):
         super().__init__()
         # Set the platform image for this world
@@ -2639,6 +2739,8 @@ class Platform(pygame.sprite.Sprite):
             # fallback: blank surface
             self.image = pygame.Surface((width, height), pygame.SRCALPHA)
         self.rect = self.image.get_rect(topleft=(x, y))
+        # Allocated once; later snapshots copy into it in place
+        self.prev_rect = self.rect.copy()
         self.world_num = world_num
         self.asset_cache = asset_cache
         # Ensure all moving platform attributes exist for update()
@@ -2650,7 +2752,7 @@ class Platform(pygame.sprite.Sprite):
         self.carry_sprites = set()
 
     def update(self) -> None:
-        self.prev_rect = self.rect.copy()
+        self.prev_rect.update(self.rect)
         move_y = 0.0
         move_x = 0.0
         if self.speed_mod != 1.0 and not self.broken:
@@ -2689,6 +2791,8 @@ class Platform(pygame.sprite.Sprite):
 class MovingPlatform(Platform):
     """Platform that oscillates along one axis for more advanced traversal challenges."""
 
+    HAS_ANCHOR = True
+
     def __init__(
         self,
         x: int,
@@ -2711,7 +2815,7 @@ class MovingPlatform(Platform):
         self._phase = phase_offset
 
     def update(self) -> None:
-        self.prev_rect = self.rect.copy()
+        self.prev_rect.update(self.rect)
         self._phase += self._speed
         oscillation = math.sin(self._phase / FPS * math.tau) * self._amplitude
         if self._horizontal:
@@ -2730,6 +2834,8 @@ class MovingPlatform(Platform):
 class BlinkingPlatform(Platform):
     """Platform that alternates between solid and intangible states on a timer."""
 
+    HAS_ANCHOR = True
+
     def __init__(
         self,
         x: int,
@@ -2762,7 +2868,7 @@ class BlinkingPlatform(Platform):
         return self._active
 
     def update(self) -> None:
-        self.prev_rect = self.rect.copy()
+        self.prev_rect.update(self.rect)
         self._timer = (self._timer + 1) % self._cycle
         should_be_active = self._timer < self._on_frames
         if should_be_active != self._active:
@@ -2780,17 +2886,25 @@ class BlinkingPlatform(Platform):
 
 class Coin(pygame.sprite.Sprite):
     effect = "collect"
+    _IMAGE: Optional[pygame.Surface] = None
 
     def __init__(self, center_x: int, center_y: int):
         super().__init__()
-        try:
-            self.image = pygame.image.load(OBJECT_DIR / "coin.png").convert_alpha()
-        except pygame.error:
-            self.image = pygame.Surface((20, 20), pygame.SRCALPHA)
-            pygame.draw.circle(self.image, (255, 215, 0), (10, 10), 10)
+        self.image = self._load_image()
         self.rect = self.image.get_rect(center=(center_x, center_y))
         self.timer = 0
 
+    @staticmethod
+    def _load_image() -> pygame.Surface:
+        # Every coin shares one surface; coin images are never modified
+        if Coin._IMAGE is None:
+            try:
+                Coin._IMAGE = pygame.image.load(OBJECT_DIR / "coin.png").convert_alpha()
+            except pygame.error:
+                Coin._IMAGE = pygame.Surface((20, 20), pygame.SRCALPHA)
+                pygame.draw.circle(Coin._IMAGE, (255, 215, 0), (10, 10), 10)
+        return Coin._IMAGE
+
     def update(self) -> None:
         pass
 
@@ -3981,7 +4095,7 @@ class SpecialTile(pygame.sprite.Sprite):
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True)
 class JumpPhysics:
     """Calculates exact player movement capabilities for level generation."""
     jump_speed: float
@@ -3996,17 +4110,18 @@ class JumpPhysics:
             max_speed=player.max_speed
         )
     
-    @property
+    # Frozen, so the derived limits are computed once instead of per can_reach
+    @functools.cached_property
     def max_jump_height(self) -> float:
         """Maximum height achievable with a perfect jump."""
         return (self.jump_speed ** 2) / (2 * self.gravity)
     
-    @property
+    @functools.cached_property
     def total_air_time(self) -> float:
         """Time spent in air during a maximum height jump."""
         return (self.jump_speed / self.gravity) * 2
     
-    @property
+    @functools.cached_property
     def max_jump_distance(self) -> float:
         """Maximum horizontal distance covered during a jump at max speed."""
         return self.max_speed * self.total_air_time
@@ -4019,8 +4134,7 @@ class JumpPhysics:
         if dy < -self.max_jump_height:
             return False
 
-        max_horizontal = self.max_speed * self.total_air_time
-        if dx > max_horizontal:
+        if dx > self.max_jump_distance:
             return False
 
         return True
@@ -4162,6 +4276,76 @@ class Checkpoint(pygame.sprite.Sprite):
 
 
 
+class Quadtree:
+    """Broad-phase index of rects; query() returns objects whose rect overlaps."""
+
+    MAX_OBJECTS = 4
+    MAX_DEPTH = 6
+
+    def __init__(self, bounds, depth: int = 0):
+        x, y, w, h = bounds
+        self.box = (x, y, x + w, y + h)
+        self.depth = depth
+        # Entries are (left, top, right, bottom, obj) so tests stay on plain ints
+        self.objects: List[Tuple[int, int, int, int, Any]] = []
+        self.children: Optional[List["Quadtree"]] = None
+
+    def _node_for(self, left: int, top: int, right: int, bottom: int) -> "Quadtree":
+        # Deepest existing node that fully contains the box (the root holds strays)
+        node = self
+        while node.children is not None:
+            for child in node.children:
+                c_left, c_top, c_right, c_bottom = child.box
+                if c_left <= left and c_top <= top and right <= c_right and bottom <= c_bottom:
+                    node = child
+                    break
+            else:
+                break
+        return node
+
+    def _split(self) -> None:
+        left, top, right, bottom = self.box
+        mid_x = left + (right - left) // 2
+        mid_y = top + (bottom - top) // 2
+        depth = self.depth + 1
+        self.children = [
+            Quadtree((left, top, mid_x - left, mid_y - top), depth),
+            Quadtree((mid_x, top, right - mid_x, mid_y - top), depth),
+            Quadtree((left, mid_y, mid_x - left, bottom - mid_y), depth),
+            Quadtree((mid_x, mid_y, right - mid_x, bottom - mid_y), depth),
+        ]
+        objects, self.objects = self.objects, []
+        for entry in objects:
+            self._node_for(*entry[:4]).objects.append(entry)
+
+    def insert(self, rect: pygame.Rect, obj: Any) -> None:
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        if left == right or top == bottom:
+            return  # empty rects never collide
+        node = self._node_for(left, top, right, bottom)
+        node.objects.append((left, top, right, bottom, obj))
+        if node.children is None and len(node.objects) > self.MAX_OBJECTS and node.depth < self.MAX_DEPTH:
+            node._split()
+
+    def query(self, rect: pygame.Rect) -> List[Any]:
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        if left == right or top == bottom:
+            return []
+        found = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            for o_left, o_top, o_right, o_bottom, obj in node.objects:
+                if left < o_right and o_left < right and top < o_bottom and o_top < bottom:
+                    found.append(obj)
+            if node.children is not None:
+                for child in node.children:
+                    c_left, c_top, c_right, c_bottom = child.box
+                    if left < c_right and c_left < right and top < c_bottom and c_top < bottom:
+                        stack.append(child)
+        return found
+
+
 @dataclass
 class LevelContent:
     platforms: pygame.sprite.Group = field(default_factory=pygame.sprite.Group)
@@ -4235,9 +4419,9 @@ def _draw_glitch_overlay(surface: pygame.Surface) -> None:
                 random.randint(180, 255),
                 random.randint(80, 180),
             )
-            glitch_rect = pygame.Surface((w, h), pygame.SRCALPHA)
-            glitch_rect.fill(color)
-            surface.blit(glitch_rect, (x, y), special_flags=pygame.BLEND_RGBA_ADD)
+            # Additive fill straight onto the target; same result as blitting a
+            # filled SRCALPHA pop with BLEND_RGBA_ADD, without the allocation
+            surface.fill(color, (x, y, w, h), special_flags=pygame.BLEND_RGBA_ADD)
     if random.random() < 0.12:
         for _ in range(random.randint(2, 6)):
             y = random.randint(0, SCREEN_HEIGHT - 1)
@@ -4553,9 +4737,9 @@ def play_first_entry_cutscene(game: "Game") -> None:
     Skippable via keyboard/mouse/controller after text appears.
     """
     # Clear any lingering input suppression so A/Start works immediately
-    game._suppress_accept_until = 0.0
+    game._suppress_accept_until_ms = 0
     # Ensure no stale suppression blocks the prompt
-    game._suppress_accept_until = 0.0
+    game._suppress_accept_until_ms = 0
     clock = game.clock
     try:
         game.sound.play_event("world_transition")
@@ -4691,7 +4875,7 @@ def play_first_entry_cutscene(game: "Game") -> None:
         clock.tick(FPS)
 
     # Suppress immediate accept in the next scene and clear any leftover inputs
-    game._suppress_accept_until = time.time() + 0.4
+    game._suppress_accept_until_ms = pygame.time.get_ticks() + 400
     pygame.event.clear()
     
 def conclude_campaign(game: "Game") -> None:
@@ -4749,6 +4933,105 @@ class WorldRule:
     object_multiplier: float = 1.0
 
 
+class PathSettings(NamedTuple):
+    gap_min: int
+    gap_max: int
+    width_min: int
+    width_max: int
+    vertical_variance: int
+    branch_chance: float
+    section_count: int
+
+
+@functools.lru_cache(maxsize=64)
+def _interp_settings(
+    settings: GeneratorSettings,
+    difficulty: float,
+    mode: str,
+    rule: WorldRule,
+    max_gap_allowed: int,
+) -> PathSettings:
+    # Settings and rules are frozen dataclasses, so they hash by value and the
+    # same (world, level, mode) always lands on the same cache entry.
+    gap_min = int(settings.gap_min.lerp(difficulty) * rule.gap_multiplier)
+    gap_max = int(settings.gap_max.lerp(difficulty) * rule.gap_multiplier)
+    gap_max = min(max_gap_allowed, max(gap_min + 12, gap_max))
+    gap_min = max(40, min(gap_min, gap_max - 12))
+
+    width_min = int(settings.width_min.lerp(difficulty))
+    width_max = int(settings.width_max.lerp(difficulty))
+    if width_max < width_min + 16:
+        width_max = width_min + 16
+
+    vertical_variance = int(settings.vertical_variance.lerp(difficulty))
+    if mode == "tower":
+        vertical_variance = int(vertical_variance * 1.45)
+
+    branch_chance = max(0.0, min(0.35, settings.branch_chance.lerp(difficulty)))
+    if mode == "tower":
+        branch_chance *= 0.4
+
+    section_count = int(round(settings.section_count.lerp(difficulty)))
+    if mode == "tower":
+        # Make 10th levels significantly longer
+        section_count = int(section_count * 1.9)
+
+    return PathSettings(
+        gap_min,
+        gap_max,
+        width_min,
+        width_max,
+        vertical_variance,
+        branch_chance,
+        section_count,
+    )
+
+
+class LevelRates(NamedTuple):
+    hazard: float
+    collectible: float
+    world_object: float
+    moving: float
+    blinking: float
+
+
+@functools.lru_cache(maxsize=64)
+def _interp_rates(settings: GeneratorSettings, difficulty: float, rule: WorldRule) -> LevelRates:
+    # Per-platform spawn rates only vary with progress along the path; the
+    # difficulty/world part is fixed for a whole level.
+    return LevelRates(
+        hazard=settings.hazard_rate.lerp(difficulty),
+        collectible=settings.collectible_rate.lerp(difficulty),
+        world_object=settings.world_object_rate.lerp(difficulty) * rule.object_multiplier,
+        moving=max(0.0, min(0.6, settings.moving_rate.lerp(difficulty))),
+        blinking=max(0.0, min(0.4, settings.blinking_rate.lerp(difficulty))),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _difficulty_curve(world: int, level: int, mode: str, rule: WorldRule) -> float:
+    # Pure in its arguments; the stock campaign only has 10 worlds x 10 levels.
+    if mode == "tower":
+        return 1.0
+    if level <= 1:
+        return 0.0
+    max_progress = (10 - 1) + (10 - 1) / 10.0
+    progress = max(0.0, (world - 1) + (level - 1) / 10.0)
+    scaled = min(1.0, progress / max_progress)
+    return max(0.0, min(1.0, scaled * rule.gap_multiplier * 0.9 + scaled * 0.1))
+
+
+def _platform_hazard_builder(
+    kind: str, dx: int, dy: int
+) -> Callable[[Platform, random.Random], Optional[pygame.sprite.Sprite]]:
+    # Hazard offset from the platform's top-centre; world_num is always set by Platform
+    def build(platform: Platform, _rng: random.Random) -> Optional[pygame.sprite.Sprite]:
+        rect = platform.rect
+        return create_hazard(kind, rect.centerx + dx, rect.top + dy, world=platform.world_num)
+
+    return build
+
+
 class LevelGenerator:
 
     """Procedural parkour generator with deterministic, scalable difficulty."""
@@ -4768,66 +5051,28 @@ class LevelGenerator:
     }
 
     HAZARD_BUILDERS: Dict[str, Callable[[Platform, random.Random], Optional[pygame.sprite.Sprite]]] = {
-        "spike": lambda platform, _rng: create_hazard(
-            "spike",
-            platform.rect.centerx - 16,
-            platform.rect.top - 16,
-            world=getattr(platform, "world_num", 1),
-        ),
-        "lava": lambda platform, _rng: create_hazard(
-            "lava",
-            platform.rect.centerx - 16,
-            platform.rect.top - 32,
-            world=getattr(platform, "world_num", 1),
-        ),
-        "icicle": lambda platform, _rng: create_hazard(
-            "icicle",
-            platform.rect.centerx - 16,
-            platform.rect.top - 32,
-            world=getattr(platform, "world_num", 1),
-        ),
-        "wind": lambda platform, _rng: create_hazard(
-            "wind",
-            platform.rect.centerx - 16,
-            platform.rect.top - 96,
-            world=getattr(platform, "world_num", 1),
-        ),
-        "electric": lambda platform, _rng: create_hazard(
-            "electric",
-            platform.rect.centerx - 16,
-            platform.rect.top - 20,
-            world=getattr(platform, "world_num", 1),
-        ),
-        "rock": lambda platform, _rng: create_hazard(
-            "rock",
-            platform.rect.centerx - 12,
-            platform.rect.top - 48,
-            world=getattr(platform, "world_num", 1),
-        ),
-        "quicksand": lambda platform, _rng: create_hazard(
-            "quicksand",
-            platform.rect.centerx - 16,
-            platform.rect.top - 8,
-            world=getattr(platform, "world_num", 1),
-        ),
-        "ghost": lambda platform, _rng: create_hazard(
-            "ghost",
-            platform.rect.centerx - 16,
-            platform.rect.top - 80,
-            world=getattr(platform, "world_num", 1),
-        ),
-        "glitch": lambda platform, _rng: create_hazard(
-            "glitch",
-            platform.rect.centerx - 10,
-            platform.rect.top - 24,
-            world=getattr(platform, "world_num", 1),
-        ),
+        "spike": _platform_hazard_builder("spike", -16, -16),
+        "lava": _platform_hazard_builder("lava", -16, -32),
+        "icicle": _platform_hazard_builder("icicle", -16, -32),
+        "wind": _platform_hazard_builder("wind", -16, -96),
+        "electric": _platform_hazard_builder("electric", -16, -20),
+        "rock": _platform_hazard_builder("rock", -12, -48),
+        "quicksand": _platform_hazard_builder("quicksand", -16, -8),
+        "ghost": _platform_hazard_builder("ghost", -16, -80),
+        "glitch": _platform_hazard_builder("glitch", -10, -24),
     }
 
     def __init__(self, assets: AssetCache, settings: Optional[GeneratorSettings] = None):
         self.assets = assets
         self.settings = settings or GeneratorSettings()
         self.physics = JumpPhysics(jump_speed=12, gravity=0.5, max_speed=6)
+        # Jump limits derived from physics; fixed for the generator's lifetime
+        self._max_gap_allowed = int(self.physics.max_jump_distance * 0.85)
+        self._max_center_gap = int(self.physics.max_jump_distance * 0.75)
+        self._max_goal_gap = int(self.physics.max_jump_distance * 0.7)
+        self._max_rise = int(self.physics.max_jump_height * 0.75)
+        self._active_hazard_builders: Tuple[Callable[[Platform, random.Random], Optional[pygame.sprite.Sprite]], ...] = ()
+        self._level_rates = _interp_rates(self.settings, 0.0, self.WORLD_RULES[0])
 
     def generate(
         self,
@@ -4845,9 +5090,10 @@ class LevelGenerator:
             if difficulty_override is not None
             else self._difficulty_for(world, level, mode)
         )
-        # Make runs feel fresh: if no seed provided, use high-entropy source (time_ns).
+        # Make runs feel fresh: if no seed provided, use high-entropy source (time_ns),
+        # mixed with a per-generator hash instead of a draw from the shared module RNG.
         if seed is None:
-            seed = time.time_ns() ^ random.randrange(1, 1_000_000_000)
+            seed = time.time_ns() ^ (id(self) * 2654435761 & 0xFFFFFFFF)
         return self.generate_level(world, difficulty, mode=mode, variant=variant, seed=seed)
 
     def generate_level(
@@ -4863,6 +5109,10 @@ class LevelGenerator:
         rng = random.Random(rng_seed)
         content = LevelContent()
         rule = self.WORLD_RULES.get(world, self.WORLD_RULES[0])
+        # Resolve the world's hazard builders once instead of per decorated platform
+        builders = self.HAZARD_BUILDERS
+        self._active_hazard_builders = tuple(builders[key] for key in rule.hazard_keys if key in builders)
+        self._level_rates = _interp_rates(self.settings, difficulty, rule)
 
         main_path = self._build_main_path(content, world, difficulty, mode, rule, rng)
         if not main_path:
@@ -4894,29 +5144,16 @@ class LevelGenerator:
             min_y = max(60, min_y - 80)
             max_y = min(max_y + 20, SCREEN_HEIGHT - 80)
 
-        gap_min = int(settings.gap_min.lerp(difficulty) * rule.gap_multiplier)
-        gap_max = int(settings.gap_max.lerp(difficulty) * rule.gap_multiplier)
-        max_gap_allowed = int(self.physics.max_jump_distance * 0.85)
-        gap_max = min(max_gap_allowed, max(gap_min + 12, gap_max))
-        gap_min = max(40, min(gap_min, gap_max - 12))
-
-        width_min = int(settings.width_min.lerp(difficulty))
-        width_max = int(settings.width_max.lerp(difficulty))
-        if width_max < width_min + 16:
-            width_max = width_min + 16
-
-        vertical_variance = int(settings.vertical_variance.lerp(difficulty))
-        if mode == "tower":
-            vertical_variance = int(vertical_variance * 1.45)
-
-        branch_chance = max(0.0, min(0.35, settings.branch_chance.lerp(difficulty)))
-        if mode == "tower":
-            branch_chance *= 0.4
-
-        section_count = int(round(settings.section_count.lerp(difficulty)))
-        if mode == "tower":
-            # Make 10th levels significantly longer
-            section_count = int(section_count * 1.9)
+        max_gap_allowed = self._max_gap_allowed
+        (
+            gap_min,
+            gap_max,
+            width_min,
+            width_max,
+            vertical_variance,
+            branch_chance,
+            section_count,
+        ) = _interp_settings(settings, difficulty, mode, rule, max_gap_allowed)
 
         start_width = max(width_max, 200)
         start_x = PLAYER_SPAWN[0] - start_width // 2
@@ -4929,11 +5166,23 @@ class LevelGenerator:
             world,
             self.assets,
         )
-        content.platforms.add(start_platform)
-
         path: List[Platform] = [start_platform]
+        # Platforms are collected in build order and added to the group once
+        built: List[Platform] = [start_platform]
         previous = start_platform
 
+        # Draw every width/height roll up front in one batch instead of two
+        # Python-level randint calls per attempt; each section makes at most
+        # 8 placement attempts. Seeded from rng so layouts stay reproducible.
+        rng_np = np.random.default_rng(rng.getrandbits(64))
+        draws = section_count * 8
+        widths = iter(rng_np.integers(width_min, width_max + 1, size=draws).tolist())
+        deltas = iter(rng_np.integers(-vertical_variance, vertical_variance + 1, size=draws).tolist())
+        # Hazard/coin/object/enemy rolls for every section, tested against
+        # their progress-scaled chances in one vectorized comparison
+        progress = np.arange(1, section_count + 1) / max(1, section_count)
+        placements = self._roll_placements(rng_np.random((section_count, 4)), progress, difficulty)
+
         for index in range(section_count):
             next_platform = self._build_next_platform(
                 previous,
@@ -4949,27 +5198,22 @@ class LevelGenerator:
                 vertical_variance,
                 min_y,
                 max_y,
+                widths,
+                deltas,
             )
-            content.platforms.add(next_platform)
+            # Settle spacing now so decorations and the next section are
+            # placed against the platform's final position
+            self._enforce_spacing(previous, next_platform)
+            built.append(next_platform)
             path.append(next_platform)
-            self._decorate_platform(
-                content,
-                next_platform,
-                world,
-                difficulty,
-                rule,
-                rng,
-                index + 1,
-                section_count,
-            )
+            self._decorate_platform(content, next_platform, world, rng, placements[index])
 
             if rng.random() < branch_chance:
-                self._maybe_add_branch_path(
+                branch = self._maybe_add_branch_path(
                     content,
                     next_platform,
                     world,
                     difficulty,
-                    rule,
                     rng,
                     gap_min,
                     gap_max,
@@ -4979,10 +5223,12 @@ class LevelGenerator:
                     min_y,
                     max_y,
                 )
+                if branch is not None:
+                    built.append(branch)
 
             previous = next_platform
 
-        self._enforce_path_spacing(path)
+        content.platforms.add(*built)
         return path
 
     def _build_next_platform(
@@ -5000,131 +5246,101 @@ class LevelGenerator:
         vertical_variance: int,
         min_y: int,
         max_y: int,
+        widths: Iterator[int],
+        deltas: Iterator[int],
     ) -> Platform:
         bias = int(vertical_variance * rule.vertical_bias)
         if mode == "tower":
             bias += int(vertical_variance * (0.5 + 0.2 * difficulty))
 
         max_gap = gap_max
-        max_center_gap = int(self.physics.max_jump_distance * 0.75)
+        max_center_gap = self._max_center_gap
+        max_rise = self._max_rise
         min_gap_pixels = 40
 
+        # previous never moves while we search, so read its rect once
+        prev_rect = previous.rect
+        prev_top = prev_rect.top
+        prev_right = prev_rect.right
+        prev_half_w = prev_rect.width // 2
+        prev_center = prev_rect.centerx
+        max_center = prev_center + max_center_gap
+
         for _ in range(8):
-            width = rng.randint(width_min, width_max)
-            delta = rng.randint(-vertical_variance, vertical_variance) - bias
-            target_y = previous.rect.y + delta
-            max_rise = int(self.physics.max_jump_height * 0.75)
-            if previous.rect.top - target_y > max_rise:
-                target_y = previous.rect.top - max_rise
-            if target_y - previous.rect.top > max_rise:
-                target_y = previous.rect.top + max_rise
+            width = next(widths)
+            delta = next(deltas) - bias
+            target_y = prev_top + delta
+            target_y = max(prev_top - max_rise, min(prev_top + max_rise, target_y))
             target_y = self._clamp_vertical_target(int(target_y), min_y, max_y)
 
-            max_gap_by_center = max_center_gap - (previous.rect.width // 2 + width // 2)
+            max_gap_by_center = max_center_gap - (prev_half_w + width // 2)
             effective_gap_max = max(min_gap_pixels, min(max_gap, max_gap_by_center))
             gap = rng.randint(min_gap_pixels, max(effective_gap_max, min_gap_pixels))
-
-            left = previous.rect.right + gap
-            candidate = self._create_platform(left, target_y, width, world, difficulty, rng)
-
-            min_center = previous.rect.right + min_gap_pixels + candidate.rect.width // 2
-            max_center = previous.rect.centerx + max_center_gap
-            if min_center > max_center:
-                min_center = max_center
-            desired_center = min(candidate.rect.centerx, max_center)
-            desired_center = max(desired_center, min_center)
-            candidate.rect.centerx = int(desired_center)
-            candidate.prev_rect = candidate.rect.copy()
-            if isinstance(candidate, MovingPlatform):
-                candidate._anchor.x = candidate.rect.x
-            if isinstance(candidate, BlinkingPlatform):
-                candidate._anchor.x = candidate.rect.x
-
-            if self._jump_possible(previous, candidate):
-                return candidate
+            kind = self._roll_platform_kind(world, difficulty, rng)
+
+            # Settle the candidate's geometry on plain ints; only an accepted
+            # placement is turned into a (texture-backed) platform
+            half_w = width // 2
+            min_center = prev_right + min_gap_pixels + half_w
+            center = max(min(min_center, max_center), min(prev_right + gap + half_w, max_center))
+            if self.physics.can_reach((prev_center, prev_top), (center, target_y)):
+                return self._create_platform(center - half_w, target_y, width, world, kind)
             max_gap = max(gap_min + 12, int(max_gap * 0.85))
 
         fallback_gap = max(gap_min, int(gap_min * 1.1))
-        left = previous.rect.right + fallback_gap
         width = max(width_min, int((width_min + width_max) / 2))
-        safe_y = self._clamp_vertical_target(previous.rect.y, min_y, max_y)
-        fallback = Platform(
-            left,
+        half_w = width // 2
+        safe_y = self._clamp_vertical_target(prev_top, min_y, max_y)
+        min_center = prev_right + min_gap_pixels + half_w
+        center = max(min(min_center, max_center), min(prev_right + fallback_gap + half_w, max_center))
+        return Platform(
+            center - half_w,
             safe_y,
             width,
             self.settings.base_platform_height,
             world,
             self.assets,
         )
-        min_center = previous.rect.right + min_gap_pixels + fallback.rect.width // 2
-        max_center = previous.rect.centerx + max_center_gap
-        if min_center > max_center:
-            min_center = max_center
-        desired_center = min(fallback.rect.centerx, max_center)
-        desired_center = max(desired_center, min_center)
-        fallback.rect.centerx = int(desired_center)
-        fallback.prev_rect = fallback.rect.copy()
-        return fallback
-
-    def _enforce_path_spacing(self, path: List[Platform]) -> None:
-        max_center_gap = int(self.physics.max_jump_distance * 0.75)
-        min_gap_pixels = 32
-        for previous, current in zip(path, path[1:]):
-            min_center = previous.rect.right + min_gap_pixels + current.rect.width // 2
-            max_center = previous.rect.centerx + max_center_gap
-            if min_center > max_center:
-                min_center = max_center
-            desired_center = min(current.rect.centerx, max_center)
-            desired_center = max(desired_center, min_center)
-            if int(desired_center) != current.rect.centerx:
-                current.rect.centerx = int(desired_center)
-                current.prev_rect = current.rect.copy()
-                if isinstance(current, MovingPlatform):
-                    current._anchor.x = current.rect.x
-                if isinstance(current, BlinkingPlatform):
-                    current._anchor.x = current.rect.x
-            max_rise = int(self.physics.max_jump_height * 0.75)
-            if previous.rect.top - current.rect.top > max_rise:
-                current.rect.top = previous.rect.top - max_rise
-                current.rect.y = current.rect.top
-            if current.rect.top - previous.rect.top > max_rise:
-                current.rect.top = previous.rect.top + max_rise
-                current.rect.y = current.rect.top
-            if isinstance(current, MovingPlatform):
-                current._anchor.y = current.rect.y
-            if isinstance(current, BlinkingPlatform):
-                current._anchor.y = current.rect.y
-            current.prev_rect = current.rect.copy()
 
-    def _create_platform(
+    def _enforce_spacing(self, previous: Platform, current: Platform) -> None:
+        max_rise = self._max_rise
+        min_gap_pixels = 32
+        prev_rect = previous.rect
+        prev_top = prev_rect.top
+        rect = current.rect
+        min_center = prev_rect.right + min_gap_pixels + rect.width // 2
+        max_center = prev_rect.centerx + self._max_center_gap
+        desired_center = max(min(min_center, max_center), min(rect.centerx, max_center))
+        if int(desired_center) != rect.centerx:
+            rect.centerx = int(desired_center)
+            if current.HAS_ANCHOR:
+                current._anchor.x = rect.x
+        rect.top = max(prev_top - max_rise, min(prev_top + max_rise, rect.top))
+        if current.HAS_ANCHOR:
+            current._anchor.y = rect.y
+        current.prev_rect.update(rect)
+
+    def _roll_platform_kind(
         self,
-        left: int,
-        top: int,
-        width: int,
         world: int,
         difficulty: float,
         rng: random.Random,
-    ) -> Platform:
-        moving_rate = max(0.0, min(0.6, self.settings.moving_rate.lerp(difficulty)))
-        blinking_rate = max(0.0, min(0.4, self.settings.blinking_rate.lerp(difficulty)))
-        height = self.settings.base_platform_height
+    ) -> Tuple[type, Dict[str, Any]]:
+        """Draw a platform's kind and parameters without building it.
+
+        The retry loop rolls this for every candidate, accepted or not, so the
+        rng advances exactly as if each candidate had been built.
+        """
+        rates = self._level_rates
+        moving_rate = rates.moving
+        blinking_rate = rates.blinking
         roll = rng.random()
 
         if roll < blinking_rate and difficulty > 0.35:
             on_frames = rng.randrange(70, 120)
             off_frames = rng.randrange(40, 90)
             phase = rng.randrange(0, on_frames + off_frames)
-            return BlinkingPlatform(
-                left,
-                top,
-                width,
-                height,
-                world,
-                self.assets,
-                on_frames=on_frames,
-                off_frames=off_frames,
-                phase_offset=phase,
-            )
+            return BlinkingPlatform, {"on_frames": on_frames, "off_frames": off_frames, "phase_offset": phase}
 
         roll -= blinking_rate
         if roll < moving_rate:
@@ -5140,61 +5356,67 @@ class LevelGenerator:
             nominal = rng.uniform(0.8, 1.6)
             speed = nominal * factor
             phase = rng.uniform(0.0, math.tau)
-            return MovingPlatform(
-                left,
-                top,
-                width,
-                height,
-                world,
-                self.assets,
-                horizontal=horizontal,
-                amplitude=amplitude,
-                speed=speed,
-                phase_offset=phase,
-            )
+            return MovingPlatform, {
+                "horizontal": horizontal,
+                "amplitude": amplitude,
+                "speed": speed,
+                "phase_offset": phase,
+            }
 
         speed_mod = 1.0
         if rng.random() < 0.15 * difficulty:
             speed_mod = rng.uniform(0.7, 1.6)
-        return Platform(left, top, width, height, world, self.assets, speed_mod=speed_mod)
+        return Platform, {"speed_mod": speed_mod}
+
+    def _create_platform(
+        self,
+        left: int,
+        top: int,
+        width: int,
+        world: int,
+        kind: Tuple[type, Dict[str, Any]],
+    ) -> Platform:
+        cls, params = kind
+        return cls(left, top, width, self.settings.base_platform_height, world, self.assets, **params)
+
+    def _roll_placements(self, rolls: np.ndarray, progress: np.ndarray, difficulty: float) -> List[List[bool]]:
+        # One row per platform: [hazard, coins, world object, enemy]
+        rates = self._level_rates
+        chances = np.column_stack(
+            (
+                np.minimum(0.85, rates.hazard * (0.5 + progress)),
+                np.maximum(0.05, rates.collectible * (1.1 - 0.5 * progress)),
+                np.minimum(0.75, rates.world_object * (0.6 + 0.4 * progress)),
+                # 18-30% enemy chance, scales with difficulty
+                np.full(len(progress), 0.18 + 0.12 * difficulty),
+            )
+        )
+        return (rolls < chances).tolist()
 
     def _decorate_platform(
         self,
         content: LevelContent,
         platform: Platform,
         world: int,
-        difficulty: float,
-        rule: WorldRule,
         rng: random.Random,
-        index: int,
-        total: int,
+        placements: List[bool],
     ) -> None:
-        if total <= 0:
-            return
-        progress = index / max(1, total)
-
-        hazard_rate = min(0.85, self.settings.hazard_rate.lerp(difficulty) * (0.5 + progress))
-        if rng.random() < hazard_rate:
-            hazard_key = rng.choice(rule.hazard_keys)
-            builder = self.HAZARD_BUILDERS.get(hazard_key)
-            if builder:
-                hazard = builder(platform, rng)
-                self._add_hazard(content, hazard)
-
-        collectible_rate = max(0.05, self.settings.collectible_rate.lerp(difficulty) * (1.1 - 0.5 * progress))
-        if rng.random() < collectible_rate:
+        place_hazard, place_coins, place_object, place_enemy = placements
+
+        if place_hazard and self._active_hazard_builders:
+            builder = rng.choice(self._active_hazard_builders)
+            hazard = builder(platform, rng)
+            self._add_hazard(content, hazard)
+
+        if place_coins:
             count = 1 if platform.rect.width < 120 else 2 + (1 if rng.random() < 0.35 else 0)
             spacing = platform.rect.width // (count + 1)
             for i in range(count):
                 coin = Coin(platform.rect.left + spacing * (i + 1), platform.rect.top - 28)
                 self._try_add_sprite(content, "coin", coin, content.coins)
 
-        object_rate = min(
-            0.75,
-            self.settings.world_object_rate.lerp(difficulty) * rule.object_multiplier * (0.6 + 0.4 * progress),
-        )
         placed_hazard = False
-        if rng.random() < object_rate:
+        if place_object:
             world_object = self._spawn_world_object(world, platform)
             if getattr(world_object, 'kind', None) == 'spike':
                 added = self._try_add_sprite(content, "spike", world_object, content.spikes)
@@ -5211,13 +5433,12 @@ class LevelGenerator:
 
         # --- ENEMY SPAWN LOGIC ---
         # Only spawn enemies on sufficiently large, non-moving platforms
-        enemy_spawn_chance = 0.18 + 0.12 * difficulty  # 18-30% chance, scales with difficulty
         min_platform_width = 90
         if (
-            platform.rect.width >= min_platform_width
-            and not isinstance(platform, (MovingPlatform, BlinkingPlatform))
+            place_enemy
+            and platform.rect.width >= min_platform_width
+            and not platform.HAS_ANCHOR
             and not placed_hazard
-            and rng.random() < enemy_spawn_chance
         ):
             # Place enemy at random x on platform
             enemy_x = rng.randint(platform.rect.left + 8, platform.rect.right - 40)
@@ -5232,7 +5453,6 @@ class LevelGenerator:
         origin: Platform,
         world: int,
         difficulty: float,
-        rule: WorldRule,
         rng: random.Random,
         gap_min: int,
         gap_max: int,
@@ -5241,7 +5461,7 @@ class LevelGenerator:
         vertical_variance: int,
         min_y: int,
         max_y: int,
-    ) -> None:
+    ) -> Optional[Platform]:
         branch_gap = rng.randint(max(40, gap_min // 2), max(60, int(gap_max * 0.6)))
         left = origin.rect.right + branch_gap
         target_y = self._clamp_vertical_target(
@@ -5252,11 +5472,12 @@ class LevelGenerator:
         width = max(64, int(width_min * 0.7))
         branch = Platform(left, target_y, width, self.settings.base_platform_height, world, self.assets)
         if not self._jump_possible(origin, branch):
-            return
-        content.platforms.add(branch)
-        self._decorate_platform(content, branch, world, difficulty, rule, rng, 0, 1)
+            return None
+        placements = self._roll_placements(np.array([[rng.random() for _ in range(4)]]), np.zeros(1), difficulty)
+        self._decorate_platform(content, branch, world, rng, placements[0])
         reward = Coin(branch.rect.centerx, branch.rect.top - 36)
         self._try_add_sprite(content, "coin", reward, content.coins)
+        return branch
 
     def _spawn_world_object(self, world: int, platform: Platform) -> Optional[pygame.sprite.Sprite]:
         sprite = create_world_object(world, platform.rect.centerx - 16, platform.rect.top - 32)
@@ -5293,6 +5514,12 @@ class LevelGenerator:
         sprite.kill()
         return False
 
+    def _add_checkpoint_unchecked(self, content: LevelContent, checkpoint: Checkpoint) -> None:
+        # Forced reservations always succeed, so skip _try_add_sprite's checks
+        # but keep the spawn-cell record
+        content.reserve_rect("checkpoint", checkpoint.rect, force=True)
+        content.checkpoints.add(checkpoint)
+
     def _place_goal(
         self,
         content: LevelContent,
@@ -5303,7 +5530,7 @@ class LevelGenerator:
         portal_type: str = "normal",
         active: bool = True,
     ) -> None:
-        max_gap = int(self.physics.max_jump_distance * 0.7)
+        max_gap = self._max_goal_gap
         gap = min(max_gap, max(60, last_platform.rect.width))
         width = max(140, int(last_platform.rect.width * 0.9))
         target_y = last_platform.rect.y
@@ -5318,13 +5545,10 @@ class LevelGenerator:
                 self.assets,
             )
             min_center = last_platform.rect.right + 32 + goal_platform.rect.width // 2
-            max_center = last_platform.rect.centerx + int(self.physics.max_jump_distance * 0.75)
-            if min_center > max_center:
-                min_center = max_center
-            desired_center = min(goal_platform.rect.centerx, max_center)
-            desired_center = max(desired_center, min_center)
+            max_center = last_platform.rect.centerx + self._max_center_gap
+            desired_center = max(min(min_center, max_center), min(goal_platform.rect.centerx, max_center))
             goal_platform.rect.centerx = int(desired_center)
-            goal_platform.prev_rect = goal_platform.rect.copy()
+            goal_platform.prev_rect.update(goal_platform.rect)
             if self._jump_possible(last_platform, goal_platform):
                 content.platforms.add(goal_platform)
                 goal = Goal(
@@ -5359,62 +5583,83 @@ class LevelGenerator:
         if len(path) < 2:
             return
 
+        # Structure-of-arrays view of the path so every checkpoint target is
+        # resolved in one vectorized lookup
+        path_cx = np.fromiter((p.rect.centerx for p in path), dtype=np.int32, count=len(path))
+        path_top = np.fromiter((p.rect.top for p in path), dtype=np.int32, count=len(path))
+
         if mode == "tower":
-            highest = min(p.rect.top for p in path)
-            lowest = max(p.rect.top for p in path)
+            highest = int(path_top.min())
+            lowest = int(path_top.max())
             vertical_span = max(0, lowest - highest)
             if vertical_span < 180:
                 return
             steps = max(1, vertical_span // 220)
-            for step in range(1, steps + 1):
-                progress = step / (steps + 1)
-                target_y = lowest - vertical_span * progress
-                platform = min(path, key=lambda p: abs(p.rect.top - target_y))
-                checkpoint = Checkpoint(platform.rect.centerx, platform.rect.top - 62)
-                self._try_add_sprite(content, "checkpoint", checkpoint, content.checkpoints, force=True)
-            return
-
-        interval = int(self.settings.checkpoint_interval.lerp(difficulty))
-        total_span = path[-1].rect.centerx - path[0].rect.centerx
-        if total_span <= interval * 1.1:
-            if difficulty < 0.5:
-                return
-            count = 1
+            targets_y = lowest - vertical_span * (np.arange(1, steps + 1) / (steps + 1))
+            # Tops are not monotonic up a tower; argmin keeps the earliest
+            # platform on ties, like min() did
+            picks = np.abs(path_top[:, None] - targets_y).argmin(axis=0)
         else:
-            count = max(1, total_span // interval)
-        for i in range(1, count + 1):
-            progress = i / (count + 1)
-            target_x = path[0].rect.centerx + total_span * progress
-            platform = min(path, key=lambda p: abs(p.rect.centerx - target_x))
-            checkpoint = Checkpoint(platform.rect.centerx, platform.rect.top - 62)
-            self._try_add_sprite(content, "checkpoint", checkpoint, content.checkpoints, force=True)
+            interval = int(self.settings.checkpoint_interval.lerp(difficulty))
+            first_cx = int(path_cx[0])
+            total_span = int(path_cx[-1]) - first_cx
+            if total_span <= interval * 1.1:
+                if difficulty < 0.5:
+                    return
+                count = 1
+            else:
+                count = max(1, total_span // interval)
+            # Path centres increase strictly from left to right (spacing keeps
+            # each platform past the previous one), so searchsorted finds the
+            # right neighbour and the left one wins when it is at least as close
+            targets_x = first_cx + total_span * (np.arange(1, count + 1) / (count + 1))
+            last = len(path) - 1
+            right = np.searchsorted(path_cx, targets_x)
+            left = np.maximum(right - 1, 0)
+            take_left = (right > last) | (
+                (right > 0) & (targets_x - path_cx[left] <= path_cx[np.minimum(right, last)] - targets_x)
+            )
+            picks = np.where(take_left, right - 1, right)
+
+        # Coordinates come straight from the path arrays; no per-pick rect lookups
+        add_checkpoint = self._add_checkpoint_unchecked
+        for x, top in zip(path_cx[picks].tolist(), path_top[picks].tolist()):
+            add_checkpoint(content, Checkpoint(x, top - 62))
 
     def _finalize_bounds(self, content: LevelContent) -> None:
-        xs: List[int] = []
-        ys: List[int] = []
+        # Track the extents as four running ints over a single sprite pass
+        min_x = min_y = 10 ** 9
+        max_x = max_y = -10 ** 9
+        found = False
         for group in (
             content.platforms,
             content.spikes,
             content.specials,
             content.coins,
             content.checkpoints,
+            (content.goal,) if content.goal else (),
         ):
             for sprite in group:
-                if hasattr(sprite, "rect"):
-                    rect = sprite.rect
-                    xs.extend((rect.left, rect.right))
-                    ys.extend((rect.top, rect.bottom))
-        if content.goal:
-            rect = content.goal.rect
-            xs.extend((rect.left, rect.right))
-            ys.extend((rect.top, rect.bottom))
-
-        if xs and ys:
+                if not hasattr(sprite, "rect"):
+                    continue
+                rect = sprite.rect
+                left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+                if left < min_x:
+                    min_x = left
+                if right > max_x:
+                    max_x = right
+                if top < min_y:
+                    min_y = top
+                if bottom > max_y:
+                    max_y = bottom
+                found = True
+
+        if found:
             padding = 120
-            content.min_x = min(xs) - padding
-            content.max_x = max(xs) + padding
-            content.min_y = min(ys) - padding
-            content.max_y = max(ys) + padding
+            content.min_x = min_x - padding
+            content.max_x = max_x + padding
+            content.min_y = min_y - padding
+            content.max_y = max_y + padding
         else:
             content.min_x = 0
             content.max_x = SCREEN_WIDTH
@@ -5422,38 +5667,98 @@ class LevelGenerator:
             content.max_y = SCREEN_HEIGHT
 
         # --- Level Checker: Ensure no objects/enemies spawn inside platforms or each other ---
-        def move_above_platform(sprite, platforms):
+        # Platforms are indexed once in a quadtree; every sweep below still
+        # visits overlapping platforms in group order, as a full scan would.
+        platforms = list(content.platforms)
+        world_bounds = (
+            content.min_x,
+            content.min_y,
+            content.max_x - content.min_x,
+            content.max_y - content.min_y,
+        )
+        platform_tree = Quadtree(world_bounds)
+        for index, plat in enumerate(platforms):
+            platform_tree.insert(plat.rect, index)
+
+        def next_platform_hit(rect, after):
+            # First platform past index `after` that overlaps rect
+            hits = [index for index in platform_tree.query(rect) if index > after]
+            return min(hits) if hits else None
+
+        def move_above_platform(sprite):
             # Move sprite above the highest platform it collides with
-            for plat in platforms:
-                if sprite.rect.colliderect(plat.rect):
-                    sprite.rect.bottom = plat.rect.top
-        # Check enemies
-        for enemy in list(content.enemies):
-            for plat in content.platforms:
-                if enemy.rect.colliderect(plat.rect):
-                    move_above_platform(enemy, content.platforms)
-            # Check for overlap with other enemies
-            for other in content.enemies:
-                if other is not enemy and enemy.rect.colliderect(other.rect):
-                    enemy.rect.y = other.rect.top - enemy.rect.height
-        # Check coins
-        for coin in list(content.coins):
-            for plat in content.platforms:
-                if coin.rect.colliderect(plat.rect):
-                    move_above_platform(coin, content.platforms)
-        # Check specials
-        for special in list(content.specials):
-            for plat in content.platforms:
-                if special.rect.colliderect(plat.rect):
-                    move_above_platform(special, content.platforms)
-        # Check spikes
-        for spike in list(content.spikes):
-            for plat in content.platforms:
-                if spike.rect.colliderect(plat.rect):
+            index = next_platform_hit(sprite.rect, -1)
+            while index is not None:
+                sprite.rect.bottom = platforms[index].rect.top
+                index = next_platform_hit(sprite.rect, index)
+
+        def settle_on_platforms(sprite):
+            index = next_platform_hit(sprite.rect, -1)
+            while index is not None:
+                move_above_platform(sprite)
+                index = next_platform_hit(sprite.rect, index)
+
+        # One pass over every dynamic sprite. Enemies come first, so an enemy's
+        # position in `dynamics` doubles as its key in the enemy tree.
+        enemies = list(content.enemies)
+        dynamics = (
+            [("enemy", enemy) for enemy in enemies]
+            + [("coin", coin) for coin in content.coins]
+            + [("special", special) for special in content.specials]
+            + [("spike", spike) for spike in content.spikes]
+        )
+        # Enemies are bucketed on a uniform grid; a bucket only ever holds
+        # enemies whose current rect touches that cell
+        cell_size = 128
+
+        def enemy_cells(rect):
+            for cx in range(rect.left // cell_size, rect.right // cell_size + 1):
+                for cy in range(rect.top // cell_size, rect.bottom // cell_size + 1):
+                    yield (cx, cy)
+
+        enemy_buckets: Dict[Tuple[int, int], Set[int]] = {}
+        for index, enemy in enumerate(enemies):
+            for cell in enemy_cells(enemy.rect):
+                enemy_buckets.setdefault(cell, set()).add(index)
+        # Moving platforms' carry groups, looked up once rather than per hit
+        carriers = [getattr(plat, "carry_sprites", None) for plat in platforms]
+        for index, (kind, sprite) in enumerate(dynamics):
+            if kind == "spike":
+                hit = next_platform_hit(sprite.rect, -1)
+                while hit is not None:
                     # Attach spike to platform if it's a moving platform
-                    if hasattr(plat, 'carry_sprites'):
-                        plat.carry_sprites.add(spike)
-                    move_above_platform(spike, [plat])
+                    carry = carriers[hit]
+                    if carry is not None:
+                        carry.add(sprite)
+                    sprite.rect.bottom = platforms[hit].rect.top
+                    hit = next_platform_hit(sprite.rect, hit)
+                continue
+            if kind != "enemy":
+                settle_on_platforms(sprite)
+                continue
+            start = sprite.rect.copy()
+            settle_on_platforms(sprite)
+            # Check for overlap with other enemies
+            after = -1
+            while True:
+                rect = sprite.rect
+                nearby = set()
+                for cell in enemy_cells(rect):
+                    nearby.update(enemy_buckets.get(cell, ()))
+                hits = [
+                    other
+                    for other in nearby
+                    if other > after and other != index and rect.colliderect(enemies[other].rect)
+                ]
+                if not hits:
+                    break
+                after = min(hits)
+                rect.y = enemies[after].rect.top - rect.height
+            if sprite.rect != start:
+                for cell in enemy_cells(start):
+                    enemy_buckets[cell].discard(index)
+                for cell in enemy_cells(sprite.rect):
+                    enemy_buckets.setdefault(cell, set()).add(index)
 
     def _derive_seed(self, world: int, level: int, variant: int) -> int:
         base = (world * 10007) + (level * 389) + variant * 7919
@@ -5462,15 +5767,7 @@ class LevelGenerator:
         return base
 
     def _difficulty_for(self, world: int, level: int, mode: str) -> float:
-        if mode == "tower":
-            return 1.0
-        if level <= 1:
-            return 0.0
-        max_progress = (10 - 1) + (10 - 1) / 10.0
-        progress = max(0.0, (world - 1) + (level - 1) / 10.0)
-        scaled = min(1.0, progress / max_progress)
-        rule = self.WORLD_RULES.get(world, self.WORLD_RULES[0])
-        return max(0.0, min(1.0, scaled * rule.gap_multiplier * 0.9 + scaled * 0.1))
+        return _difficulty_curve(world, level, mode, self.WORLD_RULES.get(world, self.WORLD_RULES[0]))
 
     @staticmethod
     def _clamp_vertical_target(target: int, min_y: int, max_y: int) -> int:
@@ -5490,6 +5787,12 @@ class CreditScene(Scene):
         self.minimum_display = 2.0
         self.prompt_visible = False
         self.fade = 0.0
+        # Only the overlay's alpha changes between frames
+        self._overlay = pygame.Surface(SCREEN_SIZE).convert()
+        self._overlay.fill((30, 0, 50))
+        self.title_font = self.game.assets.font(56, True)
+        self.subtitle_font = self.game.assets.font(28, False)
+        self.prompt_font = self.game.assets.font(20, False)
 
     def on_enter(self) -> None:
         self.timer = 0.0
@@ -5505,20 +5808,20 @@ class CreditScene(Scene):
                 key_map = self.game.settings["key_map"]
                 accept_key = key_map.get("accept", pygame.K_RETURN)
                 if event.key in (accept_key, pygame.K_SPACE, pygame.K_ESCAPE, pygame.K_BACKSPACE):
-                    self.game._suppress_accept_until = time.time() + 0.5
+                    self.game._suppress_accept_until_ms = pygame.time.get_ticks() + 500
                     self.game.change_scene(TitleScene)
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 self.game.last_input_device = "mouse"
-                self.game._suppress_accept_until = time.time() + 0.5
+                self.game._suppress_accept_until_ms = pygame.time.get_ticks() + 500
                 self.game.change_scene(TitleScene)
             elif event.type == pygame.JOYBUTTONDOWN:
                 self.game.last_input_device = "controller"
                 if event.button in (0, 7):  # A or Start
-                    self.game._suppress_accept_until = time.time() + 0.5
+                    self.game._suppress_accept_until_ms = pygame.time.get_ticks() + 500
                     self.game.change_scene(TitleScene)
             elif event.type == pygame.JOYAXISMOTION and abs(event.value) > 0.6:
                 self.game.last_input_device = "controller"
-                self.game._suppress_accept_until = time.time() + 0.5
+                self.game._suppress_accept_until_ms = pygame.time.get_ticks() + 500
                 self.game.change_scene(TitleScene)
 
     def update(self, dt: float) -> None:
@@ -5530,14 +5833,12 @@ class CreditScene(Scene):
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((10, 10, 20))
 
-        overlay = pygame.Surface(SCREEN_SIZE)
-        overlay.fill((30, 0, 50))
-        overlay.set_alpha(int(120 * self.fade))
-        surface.blit(overlay, (0, 0))
+        self._overlay.set_alpha(int(120 * self.fade))
+        surface.blit(self._overlay, (0, 0))
 
-        title_font = self.game.assets.font(56, True)
-        subtitle_font = self.game.assets.font(28, False)
-        prompt_font = self.game.assets.font(20, False)
+        title_font = self.title_font
+        subtitle_font = self.subtitle_font
+        prompt_font = self.prompt_font
 
         draw_center_text(surface, title_font, "Reality Collapsing", SCREEN_HEIGHT // 2 - 80, WHITE)
         draw_center_text(surface, subtitle_font, "Created by", SCREEN_HEIGHT // 2 - 10, CYAN)
@@ -5564,9 +5865,13 @@ class CharacterCreationScene(Scene):
         self.preview_tinted: Optional[pygame.Surface] = None
         self.preview_pos = (SCREEN_WIDTH // 2 - 240, SCREEN_HEIGHT // 2 - 40)
         self.selected_color = self.game.player_color
-        self.wheel_surface = generate_color_wheel(COLOR_WHEEL_RADIUS)
+        self._tint_buffer: Optional[pygame.Surface] = None
+        self._tint_cache: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        self.wheel_surface = _cached_color_wheel(COLOR_WHEEL_RADIUS)
         wheel_center = (SCREEN_WIDTH // 2 + 220, SCREEN_HEIGHT // 2 - 40)
         self.wheel_rect = self.wheel_surface.get_rect(center=wheel_center)
+        self._wheel_pixels = _cached_color_wheel_rgb(COLOR_WHEEL_RADIUS)
+        self._radius_sq = COLOR_WHEEL_RADIUS * COLOR_WHEEL_RADIUS
         self.selection_pos = self._pos_from_color(self.selected_color)
         self.confirm_rect = pygame.Rect(0, 0, 220, 56)
         self.back_rect = pygame.Rect(0, 0, 180, 48)
@@ -5577,6 +5882,18 @@ class CharacterCreationScene(Scene):
         self.dragging = False
         self.hover_confirm = False
         self.hover_back = False
+        # Drag motion is sampled once per frame in update(), not per event
+        self._pending_sample_pos: Optional[Tuple[int, int]] = None
+        self._last_sample_pos: Optional[Tuple[int, int]] = None
+        # Stick motion is coalesced the same way: latest axis values, one nudge per frame
+        self._axis_state = {0: 0.0, 1: 0.0}
+        self._axis_dirty = False
+        # Button labels are static; rasterize them once
+        self._btn_font = self.game.assets.font(24, True)
+        self._btn_labels = {
+            label: self._btn_font.render(label, True, WHITE).convert_alpha()
+            for label in ("Confirm", "Back")
+        }
         self._update_preview_tint()
 
     def _get_character_list(self):
@@ -5593,13 +5910,14 @@ class CharacterCreationScene(Scene):
             self.selecting_form = False
             # Set default color for character if needed
             self.selected_color = self.game.player_color
-            self.wheel_surface = generate_color_wheel(COLOR_WHEEL_RADIUS)
+            self.wheel_surface = _cached_color_wheel(COLOR_WHEEL_RADIUS)
             wheel_center = (SCREEN_WIDTH // 2 + 220, SCREEN_HEIGHT // 2 - 40)
             self.wheel_rect = self.wheel_surface.get_rect(center=wheel_center)
             self.selection_pos = self._pos_from_color(self.selected_color)
             self.confirm_rect.center = (SCREEN_WIDTH // 2 + 220, SCREEN_HEIGHT - 110)
             self.back_rect.center = (SCREEN_WIDTH // 2 - 220, SCREEN_HEIGHT - 110)
             self.dragging = False
+            self._pending_sample_pos = None
             self._update_preview_tint()
 
     def _load_preview_image(self) -> pygame.Surface:
@@ -5608,6 +5926,7 @@ class CharacterCreationScene(Scene):
         base_rect = default.get_rect()
         pygame.draw.rect(default, (200, 200, 220, 60), base_rect, border_radius=12)
         pygame.draw.rect(default, (200, 200, 220, 180), base_rect.inflate(-12, -12), border_radius=12)
+        default = default.convert_alpha()
         try:
             path = ASSET_DIR / "characters" / "player" / "idle_0.png"
             if path.exists():
@@ -5617,15 +5936,27 @@ class CharacterCreationScene(Scene):
             print(f"[CharacterCreation] Failed to load preview: {exc}")
         return default
 
+    _TINT_CACHE_SIZE = 64
+
     def _tint_surface(self, surface: pygame.Surface, color: Tuple[int, int, int]) -> pygame.Surface:
         tinted = surface.copy()
-        tint = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        # One reusable tint layer; only its fill colour changes between calls
+        tint = self._tint_buffer
+        if tint is None or tint.get_size() != surface.get_size():
+            tint = self._tint_buffer = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
         tint.fill((*color, 0))
         tinted.blit(tint, (0, 0), special_flags=pygame.BLEND_MULT)
         return tinted
 
     def _update_preview_tint(self) -> None:
-        self.preview_tinted = self._tint_surface(self.preview_image, self.selected_color)
+        # Dragging across the wheel revisits colours, so keep recent tints around
+        color = tuple(self.selected_color)
+        tinted = self._tint_cache.get(color)
+        if tinted is None:
+            if len(self._tint_cache) >= self._TINT_CACHE_SIZE:
+                del self._tint_cache[next(iter(self._tint_cache))]
+            tinted = self._tint_cache[color] = self._tint_surface(self.preview_image, color)
+        self.preview_tinted = tinted
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.QUIT:
@@ -5635,6 +5966,7 @@ class CharacterCreationScene(Scene):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self._update_selection(event.pos):
                 self.dragging = True
+                self._last_sample_pos = event.pos
                 self._update_preview_tint()
             elif self.confirm_rect.collidepoint(event.pos):
                 self._finalize_selection()
@@ -5643,8 +5975,7 @@ class CharacterCreationScene(Scene):
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             self.dragging = False
         elif event.type == pygame.MOUSEMOTION and self.dragging:
-            if self._update_selection(event.pos):
-                self._update_preview_tint()
+            self._pending_sample_pos = event.pos
 
         if event.type == pygame.KEYDOWN:
             if event.key in (pygame.K_RETURN, pygame.K_SPACE):
@@ -5666,28 +5997,39 @@ class CharacterCreationScene(Scene):
             elif event.button in (1, 2, 6):  # B / X / Back -> leave
                 self.game.change_scene(TitleScene)
         if event.type == pygame.JOYAXISMOTION and event.axis in (0, 1):
-            # Use left stick to orbit the wheel
-            if not hasattr(self, "_axis_state"):
-                self._axis_state = {0: 0.0, 1: 0.0}
+            # Use left stick to orbit the wheel; applied in update()
             self._axis_state[event.axis] = event.value
-            x = self._axis_state.get(0, 0.0)
-            y = self._axis_state.get(1, 0.0)
-            if abs(x) > 0.15 or abs(y) > 0.15:
-                # Slow stick orbiting for finer control
-                self._nudge_selection(x * 0.06, y * 0.06)
+            self._axis_dirty = True
 
     def _nudge_selection(self, dx: float, dy: float) -> None:
         # Adjust hue with dx and saturation with dy
-        r, g, b = [c / 255.0 for c in self.selected_color]
-        h, s, v = colorsys.rgb_to_hsv(r, g, b)
+        h, s, v = _color_to_hsv(tuple(self.selected_color[:3]))
         h = (h + dx) % 1.0
         s = min(1.0, max(0.0, s - dy))
         r2, g2, b2 = colorsys.hsv_to_rgb(h, s, v)
         self.selected_color = (int(r2 * 255), int(g2 * 255), int(b2 * 255))
         self.selection_pos = self._pos_from_color(self.selected_color)
+        self._last_sample_pos = None
         self._update_preview_tint()
 
-    def update(self, dt: float) -> None:  # noqa: ARG002
+    def update(self, dt: float) -> None:
+        # Apply the latest drag position; mice can report motion far faster
+        # than the frame rate
+        pos = self._pending_sample_pos
+        if pos is not None:
+            self._pending_sample_pos = None
+            if pos != self._last_sample_pos:
+                self._last_sample_pos = pos
+                if self._update_selection(pos):
+                    self._update_preview_tint()
+        if self._axis_dirty:
+            self._axis_dirty = False
+            x = self._axis_state[0]
+            y = self._axis_state[1]
+            if abs(x) > 0.15 or abs(y) > 0.15:
+                # Slow stick orbiting for finer control, scaled to a 60 FPS step
+                step = 0.06 * dt * FPS
+                self._nudge_selection(x * step, y * step)
         # Update hover states for mouse-driven highlighting
         mouse_pos = pygame.mouse.get_pos()
         self.hover_confirm = self.confirm_rect.collidepoint(mouse_pos)
@@ -5738,13 +6080,9 @@ class CharacterCreationScene(Scene):
 
     # Drawing the button (appearance)
     def _draw_button(self, surface: pygame.Surface, rect: pygame.Rect, label: str, highlighted: bool) -> None:
-        # Base colors
-        base_color = (90, 120, 210) if highlighted else (80, 80, 120)
-
-        # Hover brightness effect
-        hover = rect.collidepoint(pygame.mouse.get_pos())
-        if hover:
-            base_color = tuple(min(255, c + 25) for c in base_color)
+        # Base colors; highlighted is the hover state sampled in update(),
+        # which also gets the brightness bump
+        base_color = (115, 145, 235) if highlighted else (80, 80, 120)
 
         # Draw the button shape
         pygame.draw.rect(surface, base_color, rect, border_radius=12)
@@ -5753,8 +6091,7 @@ class CharacterCreationScene(Scene):
         pygame.draw.rect(surface, WHITE, rect, width=2, border_radius=12)
 
         # Label
-        font = self.game.assets.font(24, True)
-        text = font.render(label, True, WHITE)
+        text = self._btn_labels[label]
         surface.blit(text, text.get_rect(center=rect.center))
 
 
@@ -5773,29 +6110,25 @@ class CharacterCreationScene(Scene):
         radius = COLOR_WHEEL_RADIUS
         dx = local[0] - radius
         dy = local[1] - radius
-        if math.hypot(dx, dy) > radius:
+        if dx * dx + dy * dy > self._radius_sq:
             return False
         try:
-            color = self.wheel_surface.get_at((int(local[0]), int(local[1])))[:3]
+            r, g, b = self._wheel_pixels[int(local[0]), int(local[1])].tolist()
         except IndexError:
             return False
-        self.selected_color = color
+        self.selected_color = (r, g, b)
         self.selection_pos = (self.wheel_rect.left + int(local[0]), self.wheel_rect.top + int(local[1]))
         return True
 
     def _pos_from_color(self, color: Tuple[int, int, int]) -> Tuple[int, int]:
         if not self.wheel_rect:
             return (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40)
-        r, g, b = [c / 255.0 for c in color]
-        h, s, v = colorsys.rgb_to_hsv(r, g, b)
-        angle = h * math.tau
-        distance = min(1.0, max(0.0, s)) * COLOR_WHEEL_RADIUS
-        local_x = COLOR_WHEEL_RADIUS + int(math.cos(angle) * distance)
-        local_y = COLOR_WHEEL_RADIUS - int(math.sin(angle) * distance)
-        return (self.wheel_rect.left + local_x, self.wheel_rect.top + local_y)
+        return _wheel_pos_for_color(tuple(color[:3]), self.wheel_rect.left, self.wheel_rect.top)
 
 
 class CreditsScene(Scene):
+    _ATLAS_PAD = 256
+
     def __init__(self, game, ending_mode: bool = False):
         super().__init__(game)
         self.ending_mode = ending_mode
@@ -5819,9 +6152,29 @@ class CreditsScene(Scene):
             "",
             "Thank you for playing!",
         ]
+        # Credit lines never change, so rasterize each (shadow, text) pair once
+        # along with its blit offsets (same layout as draw_center_text)
+        font = self.game.assets.font(36, True)
+        center_x = self.game.screen.get_width() // 2
+        self._line_cache = []
+        for line in self.credits:
+            shadow = font.render(line, True, (0, 0, 0)).convert_alpha()
+            rendered = font.render(line, True, WHITE).convert_alpha()
+            shadow_rect = shadow.get_rect(center=(center_x, 3))
+            text_rect = rendered.get_rect(center=(center_x, 0))
+            self._line_cache.append((shadow, shadow_rect.x, shadow_rect.y, rendered, text_rect.x, text_rect.y))
+        # How far past a line's baseline y its pixels can reach, for culling
+        self._line_margin = max(
+            max(-sy, -ty, sy + s.get_height(), ty + t.get_height()) for s, _, sy, t, _, ty in self._line_cache
+        )
+        self._prompt_cache: Dict[str, pygame.Surface] = {}
 
         self.scroll_speed = 40
-        self.shards: List["CreditsScene.Shard"] = []
+        # Shatter shards as parallel arrays: (x, y), (dx, dy), size and colour
+        self._shard_pos = np.empty((0, 2))
+        self._shard_vel = np.empty((0, 2))
+        self._shard_size = np.empty(0, dtype=np.int64)
+        self._shard_colors: List[pygame.Color] = []
         w, h = self.game.screen.get_size()
         # Start below the bottom edge so credits scroll up onto the screen (matches title screen behavior)
         self.scroll_y = h - 40  # lowered spawn height so they begin visible sooner
@@ -5836,7 +6189,59 @@ class CreditsScene(Scene):
 
         w, h = self.game.screen.get_size()
         self.temp = pygame.Surface((w, h)).convert()
-        self.overlay = pygame.Surface((w, h), pygame.SRCALPHA)
+
+        # Static noise and scanlines are cut from oversized atlases built once;
+        # each call blits a random window instead of regenerating a surface
+        pad = self._ATLAS_PAD
+        self._noise_atlas = pygame.Surface((w + pad, h + pad), pygame.SRCALPHA)
+        arr = pygame.surfarray.pixels_alpha(self._noise_atlas)
+        arr[:, :] = np.random.default_rng().integers(0, 256, arr.shape, dtype=arr.dtype)
+        del arr
+        self._noise_atlas = self._noise_atlas.convert_alpha()
+        self._scanline_atlas = pygame.Surface((w, h + pad), pygame.SRCALPHA)
+        for y in range(0, h + pad, 4):
+            pygame.draw.line(self._scanline_atlas, (0, 0, 0, random.randint(40, 90)), (0, y), (w, y), 1)
+        self._scanline_atlas = self._scanline_atlas.convert_alpha()
+        # Full-frame passes share one scratch surface and a prebuilt flash layer
+        self._glitch_scratch = pygame.Surface((w, h)).convert()
+        self._flash_surf = pygame.Surface((w, h)).convert()
+        self._flash_surf.fill((255, 255, 255))
+        # The wireframe grid never changes
+        self._wire_surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        for y in range(0, h, 50):
+            pygame.draw.line(self._wire_surf, (80, 80, 80, 100), (0, y), (w, y))
+        for x in range(0, w, 50):
+            pygame.draw.line(self._wire_surf, (80, 80, 80, 100), (x, 0), (x, h))
+        self._wire_surf = self._wire_surf.convert_alpha()
+
+        # Effects stack with the glitch level; each pass reads the previous
+        # one's output, so the order here is part of the look
+        stages = [
+            (self.glitch_scanlines, self._maybe_static),
+            (self.glitch_slices, functools.partial(self.glitch_rgb_split, amount=4)),
+            (self.glitch_screen_shake,),
+            (self.glitch_vhs,),
+            (self.glitch_meltdown, self.glitch_wireframe),
+            (self.glitch_vortex, self.glitch_datamosh),
+            (self.glitch_blackhole, self._maybe_flash),
+            (
+                self.glitch_vortex,
+                self.glitch_blackhole,
+                functools.partial(self.glitch_slices, slices=8, max_shift=35),
+                functools.partial(self.glitch_rgb_split, amount=12),
+                self.glitch_flash,
+            ),
+        ]
+        self._glitch_dispatch: Dict[int, Tuple[Callable, ...]] = {}
+        chain: Tuple[Callable, ...] = ()
+        for lvl, stage in enumerate(stages, 1):
+            chain += stage
+            self._glitch_dispatch[lvl] = chain
+        self._glitch_enabled = False
+
+    def on_enter(self):
+        # Settings can't be changed from the credits, so read the flag once
+        self._glitch_enabled = bool(self.game.settings["glitch_fx"])
 
     def reset(self):
         w, h = self.game.screen.get_size()
@@ -5847,26 +6252,52 @@ class CreditsScene(Scene):
         self.prompt_visible = True
         self.glitch_level = 1
         self.frame_count = 0
-        self.shards.clear()
+        self._shard_pos = np.empty((0, 2))
+        self._shard_vel = np.empty((0, 2))
+        self._shard_size = np.empty(0, dtype=np.int64)
+        self._shard_colors = []
         self.exit_triggered = False
 
+    @staticmethod
+    def _shift_band(surf, y, height, dx):
+        band = surf.subsurface((0, y, surf.get_width(), height))
+        if surf.get_flags() & pygame.SRCALPHA:
+            # Blitting back blends the shifted band over the original, which
+            # is part of the look on translucent surfaces
+            surf.blit(band.copy(), (dx, y))
+        else:
+            # Opaque: scroll in place; uncovered pixels keep their old values,
+            # exactly as the copy-and-blit did
+            band.scroll(dx=dx)
+
     def glitch_static(self, surf, amount=80):
-        noise = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-        arr = pygame.surfarray.pixels_alpha(noise)
-        arr[:, :] = np.random.randint(0, 256, arr.shape, dtype=arr.dtype)
-        del arr
-        noise.set_alpha(random.randint(30, 70))
-        surf.blit(noise, (0, 0), special_flags=pygame.BLEND_SUB)
+        w, h = surf.get_size()
+        atlas = self._noise_atlas
+        ox = random.randint(0, atlas.get_width() - w)
+        oy = random.randint(0, atlas.get_height() - h)
+        atlas.set_alpha(random.randint(30, 70))
+        surf.blit(atlas, (0, 0), area=(ox, oy, w, h), special_flags=pygame.BLEND_SUB)
+
+    def _scratch_for(self, surf):
+        # The shared scratch only stands in for opaque full-frame surfaces
+        scratch = self._glitch_scratch
+        if surf.get_size() != scratch.get_size() or surf.get_flags() & pygame.SRCALPHA:
+            return None
+        return scratch
 
     def glitch_rgb_split(self, surf, amount=4):
         ox = random.randint(-amount, amount)
         oy = random.randint(-amount, amount)
-        shifted = pygame.Surface(surf.get_size()).convert()
+        shifted = self._scratch_for(surf)
+        if shifted is None:
+            shifted = pygame.Surface(surf.get_size()).convert()
+        else:
+            shifted.fill((0, 0, 0))
         shifted.blit(surf, (ox, oy))
         surf.blit(shifted, (0, 0), special_flags=pygame.BLEND_ADD)
 
     def glitch_slices(self, surf, slices=4, max_shift=30):
-        w, h = surf.get_size()
+        h = surf.get_height()
         for _ in range(slices):
             y = random.randint(0, h - 4)
             slice_h = random.randint(4, 20)
@@ -5875,24 +6306,25 @@ class CreditsScene(Scene):
             if slice_h <= 0:
                 continue
             shift = random.randint(-max_shift, max_shift)
-            slc = surf.subsurface((0, y, w, slice_h)).copy()
-            surf.blit(slc, (shift, y))
+            self._shift_band(surf, y, slice_h, shift)
 
     def glitch_scanlines(self, surf):
         w, h = surf.get_size()
-        scan = pygame.Surface((w, h), pygame.SRCALPHA)
-        for y in range(0, h, 4):
-            pygame.draw.line(scan, (0, 0, 0, random.randint(40, 90)), (0, y), (w, y), 1)
-        surf.blit(scan, (0, 0))
+        # Offsets stay on the 4px line pitch so rows line up as before
+        oy = random.randrange(0, self._scanline_atlas.get_height() - h + 1, 4)
+        surf.blit(self._scanline_atlas, (0, 0), area=(0, oy, w, h))
 
     def glitch_screen_shake(self, surf):
         ox = random.randint(-3, 3)
         oy = random.randint(-3, 3)
-        temp = surf.copy()
-        surf.blit(temp, (ox, oy))
+        if surf.get_flags() & pygame.SRCALPHA:
+            # Translucent surfaces rely on the blended blit-back (see _shift_band)
+            surf.blit(surf.copy(), (ox, oy))
+        else:
+            surf.scroll(dx=ox, dy=oy)
 
     def glitch_vhs(self, surf):
-        w, h = surf.get_size()
+        h = surf.get_height()
         for _ in range(4):
             y = random.randint(0, h - 1)
             bar_height = 2
@@ -5900,26 +6332,18 @@ class CreditsScene(Scene):
                 bar_height = h - y
             if bar_height <= 0:
                 continue
-            bar = surf.subsurface((0, y, w, bar_height)).copy()
             sx = random.randint(-20, 20)
-            surf.blit(bar, (sx, y))
+            self._shift_band(surf, y, bar_height, sx)
 
     def glitch_meltdown(self, surf):
         offset = math.sin(self.frame_count * 0.2) * 5
         surf.scroll(dx=int(offset), dy=0)
 
     def glitch_wireframe(self, surf):
-        w, h = surf.get_size()
-        wire = pygame.Surface((w, h), pygame.SRCALPHA)
-        for y in range(0, h, 50):
-            pygame.draw.line(wire, (80, 80, 80, 100), (0, y), (w, y))
-        for x in range(0, w, 50):
-            pygame.draw.line(wire, (80, 80, 80, 100), (x, 0), (x, h))
-        surf.blit(wire, (0, 0))
+        surf.blit(self._wire_surf, (0, 0))
 
     def glitch_flash(self, surf):
-        flash = pygame.Surface(surf.get_size())
-        flash.fill((255, 255, 255))
+        flash = self._flash_surf
         flash.set_alpha(random.randint(20, 120))
         surf.blit(flash, (0, 0))
 
@@ -5936,39 +6360,60 @@ class CreditsScene(Scene):
         surf.blit(scaled, rect, special_flags=pygame.BLEND_SUB)
 
     def glitch_datamosh(self, surf):
-        w, h = surf.get_size()
+        h = surf.get_height()
         slice_h = 6
         for _ in range(5):
             y = random.randint(0, h - 1)
             actual_h = slice_h if y + slice_h <= h else h - y
             if actual_h <= 0:
                 continue
-            slc = surf.subsurface((0, y, w, actual_h)).copy()
-            surf.blit(slc, (random.randint(-30, 30), y))
-
-    class Shard:
-        def __init__(self, x, y, color):
-            self.x, self.y = x, y
-            self.dx = random.uniform(-6, 6)
-            self.dy = random.uniform(-10, -4)
-            self.color = color
-            self.gravity = 0.35
-            self.size = random.randint(1, 3)
-
-        def update(self):
-            self.x += self.dx
-            self.y += self.dy
-            self.dy += self.gravity
-
-        def draw(self, surf):
-            pygame.draw.rect(surf, self.color, (int(self.x), int(self.y), self.size, self.size))
+            self._shift_band(surf, y, actual_h, random.randint(-30, 30))
+
+    SHARD_GRAVITY = 0.35
 
     def spawn_shatter(self, surf, count=120):
         w, h = surf.get_size()
+        rows = []
         for _ in range(count):
             x = random.randint(0, w - 1)
             y = random.randint(0, h - 1)
-            self.shards.append(self.Shard(x, y, surf.get_at((x, y))))
+            self._shard_colors.append(surf.get_at((x, y)))
+            dx = random.uniform(-6, 6)
+            dy = random.uniform(-10, -4)
+            rows.append((x, y, dx, dy, random.randint(1, 3)))
+        new = np.array(rows, dtype=np.float64).reshape(-1, 5)
+        self._shard_pos = np.concatenate((self._shard_pos, new[:, 0:2]))
+        self._shard_vel = np.concatenate((self._shard_vel, new[:, 2:4]))
+        self._shard_size = np.concatenate((self._shard_size, new[:, 4].astype(np.int64)))
+
+    def _update_and_draw_shards(self, surface):
+        if not self._shard_colors:
+            return
+        self._shard_pos += self._shard_vel
+        self._shard_vel[:, 1] += self.SHARD_GRAVITY
+        # astype truncates toward zero like int(); shards that have fallen
+        # off screen are skipped rather than clipped by draw.rect
+        pos = self._shard_pos.astype(np.int64)
+        size = self._shard_size
+        w, h = surface.get_size()
+        visible = np.flatnonzero(
+            (pos[:, 0] + size > 0) & (pos[:, 0] < w) & (pos[:, 1] + size > 0) & (pos[:, 1] < h)
+        )
+        colors = self._shard_colors
+        for idx, (x, y), s in zip(visible.tolist(), pos[visible].tolist(), size[visible].tolist()):
+            pygame.draw.rect(surface, colors[idx], (x, y, s, s))
+
+    def _maybe_static(self, surf):
+        if random.random() < 0.5:
+            self.glitch_static(surf)
+
+    def _maybe_flash(self, surf):
+        if random.random() < 0.5:
+            self.glitch_flash(surf)
+
+    def _apply_glitch(self, surf, lvl):
+        for effect in self._glitch_dispatch[min(lvl, len(self._glitch_dispatch))]:
+            effect(surf)
 
     def update(self, dt):
         self.frame_count += 1
@@ -6002,53 +6447,34 @@ class CreditsScene(Scene):
     def draw(self, surface):
         w, h = surface.get_size()
         self.temp.fill((0, 0, 0))
-        font = self.game.assets.font(36, True)
-        y = int(self.scroll_y)
-        for line in self.credits:
-            draw_center_text(self.temp, font, line, y, WHITE)
-            y += 48
-        if getattr(self.game.settings, "__getitem__", None) and self.game.settings["glitch_fx"]:
-            lvl = self.glitch_level
-            if lvl >= 1:
-                self.glitch_scanlines(self.temp)
-                if random.random() < 0.5:
-                    self.glitch_static(self.temp)
-            if lvl >= 2:
-                self.glitch_slices(self.temp)
-                self.glitch_rgb_split(self.temp, 4)
-            if lvl >= 3:
-                self.glitch_screen_shake(self.temp)
-            if lvl >= 4:
-                self.glitch_vhs(self.temp)
-            if lvl >= 5:
-                self.glitch_meltdown(self.temp)
-                self.glitch_wireframe(self.temp)
-            if lvl >= 6:
-                self.glitch_vortex(self.temp)
-                self.glitch_datamosh(self.temp)
-            if lvl >= 7:
-                self.glitch_blackhole(self.temp)
-                if random.random() < 0.5:
-                    self.glitch_flash(self.temp)
-            if lvl >= 8:
-                self.glitch_vortex(self.temp)
-                self.glitch_blackhole(self.temp)
-                self.glitch_slices(self.temp, 8, 35)
-                self.glitch_rgb_split(self.temp, 12)
-                self.glitch_flash(self.temp)
+        # Lines are 48px apart, so the visible slice can be computed directly
+        y0 = int(self.scroll_y)
+        margin = self._line_margin
+        first = max(0, -(y0 + margin) // 48 + 1)
+        last = min(len(self._line_cache), -((y0 - h - margin) // 48))
+        blit = self.temp.blit
+        for i in range(first, last):
+            shadow, sx, sy, rendered, tx, ty = self._line_cache[i]
+            y = y0 + 48 * i
+            blit(shadow, (sx, y + sy))
+            blit(rendered, (tx, y + ty))
+        if self._glitch_enabled:
+            self._apply_glitch(self.temp, self.glitch_level)
         surface.blit(self.temp, (0, 0))
         if self.done:
-            for shard in self.shards:
-                shard.update()
-                shard.draw(surface)
+            self._update_and_draw_shards(surface)
         if self.done and self.prompt_visible:
-            pfont = self.game.assets.font(28, True)
-            prompt_surf = pygame.Surface((w, 50), pygame.SRCALPHA)
-            prompt_surf.fill((0, 0, 0, 0))
             device = getattr(self.game, "last_input_device", "keyboard")
-            prompt_text = "Press any button to return to Title Screen"
-            draw_prompt_with_icons(prompt_surf, pfont, prompt_text, 25, WHITE, device=device)
-            if getattr(self.game.settings, "__getitem__", None) and self.game.settings["glitch_fx"]:
+            prompt_surf = self._prompt_cache.get(device)
+            if prompt_surf is None:
+                pfont = self.game.assets.font(28, True)
+                prompt_surf = pygame.Surface((w, 50), pygame.SRCALPHA)
+                prompt_text = "Press any button to return to Title Screen"
+                draw_prompt_with_icons(prompt_surf, pfont, prompt_text, 25, WHITE, device=device)
+                self._prompt_cache[device] = prompt_surf
+            if self._glitch_enabled:
+                # The glitch passes draw into the surface, so work on a copy
+                prompt_surf = prompt_surf.copy()
                 self.glitch_scanlines(prompt_surf)
                 if random.random() < 0.5:
                     self.glitch_static(prompt_surf)
@@ -6069,16 +6495,16 @@ class CreditsScene(Scene):
                 pygame.JOYHATMOTION,
             ):
                 self.exit_triggered = True
-                self.game._suppress_accept_until = time.time() + 0.5
+                self.game._suppress_accept_until_ms = pygame.time.get_ticks() + 500
                 self.game.change_scene(TitleScene)
             else:
                 if event.type == pygame.KEYDOWN:
                     self.exit_triggered = True
-                    self.game._suppress_accept_until = time.time() + 0.5
+                    self.game._suppress_accept_until_ms = pygame.time.get_ticks() + 500
                     self.game.change_scene(TitleScene)
                 elif event.type == pygame.JOYBUTTONDOWN and event.button in (0, 7):  # A or Start
                     self.exit_triggered = True
-                    self.game._suppress_accept_until = time.time() + 0.5
+                    self.game._suppress_accept_until_ms = pygame.time.get_ticks() + 500
                     self.game.change_scene(TitleScene)
         elif not self.done and not self.ending_mode:
             if event.type == pygame.KEYDOWN:
@@ -6101,15 +6527,21 @@ class TitleScene(Scene):
         self.game.change_scene(ShopsHubScene)
 
     # Konami code: up up down down left right left right b a enter
-    _konami_code = [
+    _konami_code = (
         pygame.K_UP, pygame.K_UP, pygame.K_DOWN, pygame.K_DOWN,
         pygame.K_LEFT, pygame.K_RIGHT, pygame.K_LEFT, pygame.K_RIGHT,
         pygame.K_b, pygame.K_a, pygame.K_RETURN
-    ]
-    _konami_progress = 0
+    )
 
     def __init__(self, game: "Game"):
         super().__init__(game)
+        # Secret codes run as small (state, key) -> state matchers, so each
+        # keydown is one dict lookup per code and overlapping starts still count
+        self._secret_codes: List[Tuple[Tuple[int, ...], Dict[Tuple[int, int], int], Callable[[], None]]] = [
+            (code, self._code_transitions(code), activate)
+            for code, activate in ((self._konami_code, self._activate_konami),)
+        ]
+        self._code_progress = [0] * len(self._secret_codes)
         self.bg_anim_time = 0.0
         self.bg_glitch_timer = 0.0
         self.bg_glitch_active = False
@@ -6117,6 +6549,16 @@ class TitleScene(Scene):
         self.logo_anim_time = 0.0
         self.logo_rect = pygame.Rect(0, 0, 1100, 140)
         self.logo_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 180)
+        # Persistent overlay layer for the background noise
+        self._noise_rng = np.random.default_rng()
+        # Private generator for the logo/menu flicker; keeps the title's
+        # per-frame rolls off the shared module-level random instance
+        self._rand = random.Random()
+        self._noise_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        # Rendered menu labels keyed by (text, size, color)
+        self._entry_cache: Dict[Tuple[str, int, Tuple[int, int, int]], pygame.Surface] = {}
+        self._logo_white: Optional[pygame.Surface] = None
+        self._refresh_logo_assets()
         self.menu = VerticalMenu(
             [
                 MenuEntry(lambda: " Start New Game", self.start_new_game),
@@ -6184,10 +6626,58 @@ class TitleScene(Scene):
         ])
         clock = self.game.clock
         glitch_fx = self.game.settings["glitch_fx"]
+        # The only events the popup and its menu react to, plus window re-exposes
+        expose_types = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+        popup_event_types = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN) + expose_types
+
+        # Draw taller popup overlay, but keep menu position as before
+        popup_w, popup_h = 640, 440
+        popup_x = (SCREEN_WIDTH - popup_w) // 2
+        popup_y = (SCREEN_HEIGHT - popup_h) // 2
+        popup_rect = pygame.Rect(popup_x, popup_y, popup_w, popup_h)
+        # The popup chrome and text never change while it is open, so build them once
+        overlay = pygame.Surface((popup_w, popup_h), pygame.SRCALPHA)
+        overlay.fill((20, 20, 30, 240))
+        pygame.draw.rect(overlay, (90, 120, 255, 180), overlay.get_rect(), width=5, border_radius=22)
+        overlay = overlay.convert_alpha()
+        center_x = self.game.screen.get_width() // 2
+        font = self.game.assets.font(38, True)
+        font2 = self.game.assets.font(24, True)
+        static_text = []
+        texts = [("This will erase your current progress.", font2, popup_y + 140)]
+        if not glitch_fx:
+            # Without glitch layers the title is plain centered text
+            texts.insert(0, ("START NEW GAME?", font, popup_y + 74))
+        for text, text_font, y in texts:
+            # Same layout as draw_center_text
+            shadow = text_font.render(text, True, (0, 0, 0))
+            static_text.append((shadow, shadow.get_rect(center=(center_x, y + 3))))
+            rendered = text_font.render(text, True, WHITE)
+            static_text.append((rendered, rendered.get_rect(center=(center_x, y))))
+
+        # Without glitch FX the popup only changes in response to input, so it
+        # is redrawn on events; the first frame and re-exposes repaint the lot
+        full_present = True
+        # ...and the title screen behind it is static, so paint it once and
+        # only restore the popup area from the snapshot
+        background = None
+        if not glitch_fx:
+            self.draw(self.game.screen)
+            background = self.game.screen.copy()
         while running and self.game.running:
-            # Poll controller to allow confirm/cancel via gamepad
+            # Poll controller to allow confirm/cancel via gamepad (it posts
+            # synthetic KEYDOWNs, so raw joystick events aren't needed here)
             self.game._poll_controller()
-            for event in pygame.event.get():
+            # Sleep until input arrives or the next frame is due
+            first = pygame.event.wait(1000 // FPS)
+            events = [first] if first.type in popup_event_types else []
+            events += pygame.event.get(popup_event_types)
+            # Drop everything else (axis/motion floods, key-ups) without a second pump
+            pygame.event.clear(pump=False)
+            for event in events:
+                if event.type in expose_types:
+                    full_present = True
+                    continue
                 if event.type == pygame.QUIT:
                     self.game.quit()
                     return
@@ -6197,34 +6687,31 @@ class TitleScene(Scene):
                     return
                 elif result == "cancel":
                     return
+            if not (events or glitch_fx or full_present):
+                continue
 
             # Redraw the main menu in the background
-            self.draw(self.game.screen)
-
-
-
+            if background is None:
+                self.draw(self.game.screen)
+            else:
+                self.game.screen.blit(background, popup_rect, popup_rect)
 
-            # Draw taller popup overlay, but keep menu position as before
-            popup_w, popup_h = 640, 440
-            popup_x = (SCREEN_WIDTH - popup_w) // 2
-            popup_y = (SCREEN_HEIGHT - popup_h) // 2
-            popup_rect = pygame.Rect(popup_x, popup_y, popup_w, popup_h)
-            overlay = pygame.Surface((popup_w, popup_h), pygame.SRCALPHA)
-            overlay.fill((20, 20, 30, 240))
-            pygame.draw.rect(overlay, (90, 120, 255, 180), overlay.get_rect(), width=5, border_radius=22)
             self.game.screen.blit(overlay, (popup_x, popup_y))
-
-            # Glitchy warning text
-            font = self.game.assets.font(38, True)
-            draw_glitch_text(self.game.screen, font, "START NEW GAME?", popup_y + 74, WHITE, glitch_fx)
-            font2 = self.game.assets.font(24, True)
-            draw_center_text(self.game.screen, font2, "This will erase your current progress.", popup_y + 140, WHITE, glitch_fx)
+            if glitch_fx:
+                # Glitchy warning text is re-jittered every frame
+                draw_glitch_text(self.game.screen, font, "START NEW GAME?", popup_y + 74, WHITE, glitch_fx)
+            self.game.screen.blits(static_text, doreturn=False)
 
             # Draw the confirm/cancel menu at the original position (as before)
             menu_y = popup_y + 250
             menu.draw(self.game.screen, self.game.assets, menu_y, glitch_fx)
 
-            pygame.display.flip()
+            if glitch_fx or full_present:
+                pygame.display.flip()
+            else:
+                # The background is static, so only the popup needs presenting
+                pygame.display.update(popup_rect)
+            full_present = False
             clock.tick(FPS)
 
     def continue_game(self) -> None:
@@ -6265,19 +6752,13 @@ class TitleScene(Scene):
     def handle_event(self, event: pygame.event.Event) -> None:
         # 'self' is the instance, 'event' is passed in from the caller
         if event.type == pygame.KEYDOWN:
-            if event.key == self._konami_code[self._konami_progress]:
-                self._konami_progress += 1
-                if self._konami_progress == len(self._konami_code):
-                    self._konami_progress = 0
-                    self.game.sound.play_event("menu_confirm")
-                    from main import LevelSelectScene
-                    self.game.change_scene(LevelSelectScene)
+            progress = self._code_progress
+            for idx, (code, transitions, activate) in enumerate(self._secret_codes):
+                progress[idx] = transitions.get((progress[idx], event.key), 0)
+                if progress[idx] == len(code):
+                    progress[:] = [0] * len(progress)
+                    activate()
                     return
-            else:
-                if event.key == self._konami_code[0]:
-                    self._konami_progress = 1
-                else:
-                    self._konami_progress = 0
 
         result = self.menu.handle_event(event)
         if result == "exit":
@@ -6285,11 +6766,31 @@ class TitleScene(Scene):
 
 
 
+    @staticmethod
+    def _code_transitions(code: Tuple[int, ...]) -> Dict[Tuple[int, int], int]:
+        # KMP-style automaton: after matching code[:state] and then seeing key,
+        # advance to the longest prefix of code that ends the input so far
+        # (missing entries mean back to 0)
+        table: Dict[Tuple[int, int], int] = {}
+        for state in range(len(code)):
+            for key in set(code):
+                seen = code[:state] + (key,)
+                for length in range(len(seen), 0, -1):
+                    if seen[-length:] == code[:length]:
+                        table[(state, key)] = length
+                        break
+        return table
+
+    def _activate_konami(self) -> None:
+        self.game.sound.play_event("menu_confirm")
+        from main import LevelSelectScene
+        self.game.change_scene(LevelSelectScene)
+
     def update(self, dt: float) -> None:
         self.bg_anim_time += dt
         if self.game.settings["glitch_fx"]:
             self.bg_glitch_timer += dt
-            if self.bg_glitch_timer > random.uniform(1.2, 2.5):
+            if self.bg_glitch_timer > self._rand.uniform(1.2, 2.5):
                 self.bg_glitch_active = not self.bg_glitch_active
                 self.bg_glitch_timer = 0.0
             self.logo_anim_time += dt
@@ -6300,56 +6801,67 @@ class TitleScene(Scene):
         # Fill background
         t = self.bg_anim_time
         surface.fill(self.background_color)
+        glitch_fx = self.game.settings["glitch_fx"]
+        cx = SCREEN_WIDTH // 2
+        randrange = self._rand.randrange
 
         # Draw animated glitch text as the title logo
         # Render the logo as a single long line with glitch effect
-        logo_text = "REALITY COLLAPSING"
-        font = self.game.assets.font(112, True)
         y = self.logo_rect.centery
-        if self.game.settings["glitch_fx"]:
+        logo = self._logo_white
+        if glitch_fx:
+            font = self._font_logo
             for i in range(5):
                 offset_x = int(math.sin(self.logo_anim_time * 2.5 + i) * 8)
                 offset_y = int(math.cos(self.logo_anim_time * 2.1 + i) * 3)
                 color = (
-                    random.randint(180, 255),
-                    random.randint(80, 255),
-                    random.randint(200, 255),
+                    randrange(180, 256),
+                    randrange(80, 256),
+                    randrange(200, 256),
                 )
-                # Draw with horizontal offset for glitchy look
-                render = font.render(logo_text, True, color)
-                rect = render.get_rect(center=(SCREEN_WIDTH // 2 + offset_x, y + offset_y))
+                # Draw with horizontal offset for glitchy look; the random
+                # colours rule out caching, but glyphs are cached by the font
+                render = font.render("REALITY COLLAPSING", True, color)
+                rect = render.get_rect(center=(cx + offset_x, y + offset_y))
                 surface.blit(render, rect)
-            # Draw a strong white layer on top for clarity
-            render = font.render(logo_text, True, WHITE)
-            rect = render.get_rect(center=(SCREEN_WIDTH // 2, y))
-            surface.blit(render, rect)
-        else:
-            render = font.render(logo_text, True, WHITE)
-            rect = render.get_rect(center=(SCREEN_WIDTH // 2, y))
-            surface.blit(render, rect)
+        # Strong white layer on top for clarity (the whole logo without glitch FX)
+        surface.blit(logo, logo.get_rect(center=(cx, y)))
 
         # Glitch/noise overlays (unchanged)
-        if self.game.settings["glitch_fx"]:
-            noise = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            for _ in range(400):
-                nx = random.randint(0, SCREEN_WIDTH - 1)
-                ny = random.randint(0, SCREEN_HEIGHT - 1)
-                alpha = random.randint(30, 80)
-                noise.set_at((nx, ny), (255, 255, 255, alpha))
+        if glitch_fx:
+            rng = self._noise_rng
+            noise = self._noise_surf
+            noise.fill((0, 0, 0, 0))
+            # Scatter 400 white specks in one go instead of per-pixel set_at
+            xs = rng.integers(0, SCREEN_WIDTH, 400)
+            ys = rng.integers(0, SCREEN_HEIGHT, 400)
+            rgb = pygame.surfarray.pixels3d(noise)
+            rgb[xs, ys] = 255
+            del rgb
+            alpha = pygame.surfarray.pixels_alpha(noise)
+            alpha[xs, ys] = rng.integers(30, 81, 400, dtype=np.uint8)
+            del alpha
             surface.blit(noise, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
             if self.bg_glitch_active:
-                glitch = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                for _ in range(6):
-                    gy = random.randint(0, SCREEN_HEIGHT - 1)
-                    gh = random.randint(8, 32)
-                    color = (
-                        random.randint(180, 255),
-                        random.randint(0, 255),
-                        random.randint(180, 255),
-                        random.randint(60, 120),
-                    )
-                    pygame.draw.rect(glitch, color, (0, gy, SCREEN_WIDTH, gh))
-                surface.blit(glitch, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                bar_ys = rng.integers(0, SCREEN_HEIGHT, 6).tolist()
+                bar_hs = rng.integers(8, 33, 6).tolist()
+                colors = rng.integers((180, 0, 180, 60), (256, 256, 256, 121), (6, 4)).tolist()
+                # Add the bars straight onto the frame. Where bars overlap only
+                # the last one counts (they used to be painted onto a layer
+                # first), so walk them newest-first and skip covered rows.
+                covered: List[Tuple[int, int]] = []
+                for gy, gh, color in zip(reversed(bar_ys), reversed(bar_hs), reversed(colors)):
+                    spans = [(gy, gy + gh)]
+                    for top, bottom in covered:
+                        spans = [
+                            piece
+                            for a, b in spans
+                            for piece in ((a, min(b, top)), (max(a, bottom), b))
+                            if piece[0] < piece[1]
+                        ]
+                    for a, b in spans:
+                        surface.fill(color, (0, a, SCREEN_WIDTH, b - a), special_flags=pygame.BLEND_RGBA_ADD)
+                    covered.append((gy, gy + gh))
 
         # Title logo is now rendered as animated glitch text above
 
@@ -6357,36 +6869,67 @@ class TitleScene(Scene):
         logo_bottom = self.logo_rect.bottom if self.logo_rect else (SCREEN_HEIGHT // 2 - 120 + 80)
         menu_y = logo_bottom + 20  # Move buttons up by reducing the offset
         t = self.bg_anim_time
-        entry_rects: List[pygame.Rect] = []
+        entry_blits: List[Tuple[pygame.Surface, pygame.Rect]] = []
         for idx, entry in enumerate(self.menu.entries):
             is_selected = (self.menu.selected == idx)
-            font = self.game.assets.font(36 if is_selected else 28, True)
+            size = 36 if is_selected else 28
             text = entry.label() if callable(entry.label) else str(entry.label)
             color = (255, 255, 255) if is_selected else (180, 180, 200)
             y = menu_y + idx * 54
             if is_selected:
                 y += int(6 * math.sin(t * 2.2 + idx))
-            if self.game.settings["glitch_fx"] and is_selected and random.random() < 0.12:
+            if glitch_fx and is_selected and self._rand.random() < 0.12:
+                # Flicker colours are one-offs; render them without caching
                 color = (
-                    random.randint(200, 255),
-                    random.randint(100, 255),
-                    random.randint(200, 255),
+                    randrange(200, 256),
+                    randrange(100, 256),
+                    randrange(200, 256),
                 )
-            render = font.render(text, True, color)
-            rect = render.get_rect(center=(SCREEN_WIDTH // 2, y))
-            surface.blit(render, rect)
-            # Store hit-rects so the menu can react to mouse hover/click like settings menu
-            padded = rect.inflate(32, 18)
-            entry_rects.append(padded)
-        # Update cached rects for mouse input
-        self.menu._last_entry_rects = entry_rects
+                font = self._font_selected if is_selected else self._font_normal
+                render = font.render(text, True, color)
+            else:
+                render = self._entry_label(text, size, color)
+            rect = render.get_rect(center=(cx, y))
+            entry_blits.append((render, rect))
+        surface.blits(entry_blits, doreturn=False)
+        # Store padded hit-rects so the menu can react to mouse hover/click like settings menu
+        self.menu._last_entry_rects = [rect.inflate(32, 18) for _, rect in entry_blits]
 
         # Subtle bottom info (well below logo)
-        info_font = self.game.assets.font(18, False)
-        draw_center_text(surface, info_font, "v1.0  |  Reality Collapsing  |  by James Griepentrog", SCREEN_HEIGHT - 36, (120, 120, 160))
+        surface.blits(self._info_blits, doreturn=False)
+
+    _ENTRY_CACHE_SIZE = 32
+
+    def _entry_label(self, text: str, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (text, size, color)
+        render = self._entry_cache.get(key)
+        if render is None:
+            if len(self._entry_cache) >= self._ENTRY_CACHE_SIZE:
+                del self._entry_cache[next(iter(self._entry_cache))]
+            font = self._font_selected if size == 36 else self._font_normal
+            render = self._entry_cache[key] = font.render(text, True, color).convert_alpha()
+        return render
 
     def _refresh_logo_assets(self) -> None:
-        pass  # No longer needed; logo is now glitch text
+        # The logo is glitch text now: prefetch its fonts and the plain white layer.
+        # None of it depends on settings, so build it once per scene
+        if self._logo_white is not None:
+            return
+        assets = self.game.assets
+        self._font_logo = assets.font(112, True)
+        self._logo_white = self._font_logo.render("REALITY COLLAPSING", True, WHITE).convert_alpha()
+        self._font_selected = assets.font(36, True)
+        self._font_normal = assets.font(28, True)
+        self._font_info = assets.font(18, False)
+        # The footer never changes; keep its (shadow, text) pair laid out like draw_center_text
+        info_text = "v1.0  |  Reality Collapsing  |  by James Griepentrog"
+        info_y = SCREEN_HEIGHT - 36
+        shadow = self._font_info.render(info_text, True, (0, 0, 0)).convert_alpha()
+        rendered = self._font_info.render(info_text, True, (120, 120, 160)).convert_alpha()
+        self._info_blits = [
+            (shadow, shadow.get_rect(center=(SCREEN_WIDTH // 2, info_y + 3))),
+            (rendered, rendered.get_rect(center=(SCREEN_WIDTH // 2, info_y))),
+        ]
 
 class LevelSelectScene(Scene):
     def __init__(self, game: "Game"):
@@ -6398,6 +6941,21 @@ class LevelSelectScene(Scene):
         self.max_level = 10
         self.boss_world = 11  # Special value for boss levels
         self.boss_levels = 10
+        # (world, level) to land on when stepping left/right; the boss fights
+        # sit between the last world and world 1
+        self._left_map = {
+            1: (self.boss_world, 1),
+            self.boss_world: (self.max_world, self.max_level),
+            **{w: (w - 1, 1) for w in range(2, self.max_world + 1)},
+        }
+        self._right_map = {
+            self.max_world: (self.boss_world, 1),
+            self.boss_world: (1, 1),
+            **{w: (w + 1, 1) for w in range(1, self.max_world)},
+        }
+        self._font_big = self.game.assets.font(40, True)
+        self._font_mid = self.game.assets.font(32, True)
+        self._font_small = self.game.assets.font(22, False)
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.QUIT:
@@ -6421,65 +6979,38 @@ class LevelSelectScene(Scene):
                 else:
                     self.level = self.level - 1 if self.level > 1 else self.max_level
             elif event.key in (pygame.K_LEFT, pygame.K_a):
-                if self.world == 1:
-                    self.world = self.boss_world
-                    self.level = 1
-                elif self.world == self.boss_world:
-                    self.world = self.max_world
-                    self.level = self.max_level
-                else:
-                    self.world = self.world - 1
-                    self.level = 1
+                self._step_world(-1)
             elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                if self.world == self.max_world:
-                    self.world = self.boss_world
-                    self.level = 1
-                elif self.world == self.boss_world:
-                    self.world = 1
-                    self.level = 1
-                else:
-                    self.world = self.world + 1
-                    self.level = 1
+                self._step_world(1)
         if event.type == pygame.JOYHATMOTION:
             hx, hy = event.value
             # Up/Down already come in via injected KEYDOWN events; only handle left/right here to avoid double steps
             if hx == -1:
-                if self.world == 1:
-                    self.world = self.boss_world
-                    self.level = 1
-                elif self.world == self.boss_world:
-                    self.world = self.max_world
-                    self.level = self.max_level
-                else:
-                    self.world = self.world - 1
-                    self.level = 1
+                self._step_world(-1)
             elif hx == 1:
-                if self.world == self.max_world:
-                    self.world = self.boss_world
-                    self.level = 1
-                elif self.world == self.boss_world:
-                    self.world = 1
-                    self.level = 1
-                else:
-                    self.world = self.world + 1
-                    self.level = 1
+                self._step_world(1)
+
+    def _step_world(self, delta: int) -> None:
+        table = self._left_map if delta < 0 else self._right_map
+        self.world, self.level = table.get(self.world, (self.world + delta, 1))
 
     def update(self, dt: float) -> None:
         self.blink = (self.blink + 1) % 60
 
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((10, 10, 20))
-        font_big = self.game.assets.font(40, True)
-        font_mid = self.game.assets.font(32, True)
-        font_small = self.game.assets.font(22, False)
+        font_big = self._font_big
+        font_mid = self._font_mid
+        font_small = self._font_small
+        glitch_fx = self.game.settings["glitch_fx"]
 
-        draw_glitch_text(surface, font_big, "LEVEL SELECT", 120, WHITE, self.game.settings["glitch_fx"])
+        draw_glitch_text(surface, font_big, "LEVEL SELECT", 120, WHITE, glitch_fx)
         if self.world == self.boss_world:
-            draw_glitch_text(surface, font_mid, "Boss Fights", 260, WHITE, self.game.settings["glitch_fx"])
-            draw_glitch_text(surface, font_mid, f"Boss {self.level}", 320, WHITE, self.game.settings["glitch_fx"])
+            draw_glitch_text(surface, font_mid, "Boss Fights", 260, WHITE, glitch_fx)
+            draw_glitch_text(surface, font_mid, f"Boss {self.level}", 320, WHITE, glitch_fx)
         else:
-            draw_glitch_text(surface, font_mid, f"World {self.world}", 260, WHITE, self.game.settings["glitch_fx"])
-            draw_glitch_text(surface, font_mid, f"Level {self.level}", 320, WHITE, self.game.settings["glitch_fx"])
+            draw_glitch_text(surface, font_mid, f"World {self.world}", 260, WHITE, glitch_fx)
+            draw_glitch_text(surface, font_mid, f"Level {self.level}", 320, WHITE, glitch_fx)
 
         if self.blink < 30:
             device = getattr(self.game, "last_input_device", "keyboard")
@@ -6491,6 +7022,26 @@ class LevelSelectScene(Scene):
 
 
 
+def _rounded_box(size: Tuple[int, int], fill, border, radius: int) -> pygame.Surface:
+    """A filled rounded rect with a 2px border, as two draw.rect calls would paint it."""
+    box = pygame.Surface(size, pygame.SRCALPHA)
+    rect = box.get_rect()
+    pygame.draw.rect(box, fill, rect, border_radius=radius)
+    pygame.draw.rect(box, border, rect, 2, border_radius=radius)
+    return box.convert_alpha() if pygame.display.get_surface() else box
+
+
+@functools.lru_cache(maxsize=8)
+def _none_placeholder(size: Tuple[int, int]) -> pygame.Surface:
+    # Red cross shown for the "None" entry of every cosmetics tab
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    line_width = max(6, min(size) // 10)
+    pad = max(10, min(size) // 6)
+    pygame.draw.line(surface, (220, 60, 60, 255), (pad, pad), (size[0] - pad, size[1] - pad), line_width)
+    pygame.draw.line(surface, (220, 60, 60, 255), (size[0] - pad, pad), (pad, size[1] - pad), line_width)
+    return surface.convert_alpha()
+
+
 class CosmeticsShopScene(Scene):
     """Cosmetics shop for outfits, hats, and trails."""
     def __init__(self, game: "Game", return_scene: Optional["GameplayScene"] = None):
@@ -6563,7 +7114,22 @@ class CosmeticsShopScene(Scene):
         self._tab_rects: List[pygame.Rect] = []
         self.items: List[Tuple[str, int]] = []
         self._item_rects: List[pygame.Rect] = []
-        self._item_cache: Dict[Tuple[str, str, Tuple[int, int]], pygame.Surface] = {}
+        # Centres of each item's name, preview and status, laid out by _rebuild_layout
+        self._tab_label_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._name_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._preview_positions: List[Tuple[int, int]] = []
+        self._status_positions: List[Tuple[int, int]] = []
+        # Placed status labels keyed by (item index, status text)
+        self._status_blits: Dict[Tuple[int, str], Tuple[pygame.Surface, Tuple[int, int]]] = {}
+        self._image_size = (64, 64)
+        self._tab_boxes: Dict[bool, pygame.Surface] = {}
+        self._item_boxes: Dict[bool, pygame.Surface] = {}
+        self._layout_dirty = True
+        # (coins, placed "Coins: N" blits) for the last count drawn
+        self._coin_line: Tuple[int, Tuple[Tuple[pygame.Surface, Tuple[int, int]], ...]] = (-1, ())
+        # (x0, y0, item_w, item_h, gap, cols) of the last drawn grid, for hit-testing
+        self._grid_layout: Optional[Tuple[int, int, int, int, int, int]] = None
+        self._item_cache: Dict[Tuple[str, str, Tuple[int, int]], Optional[pygame.Surface]] = {}
         self._grid_cols = 1
         self.selected_index = 0
         self.scroll_row = 0
@@ -6571,14 +7137,14 @@ class CosmeticsShopScene(Scene):
         self._visible_rows = 1
         self._refresh_items()
 
-    def _owned(self, kind: str) -> List[str]:
+    def _owned(self, kind: str) -> Iterable[str]:
         key_map = {
             "outfit": "owned_outfits",
             "trail": "owned_trails",
             "hat": "owned_hats",
         }
         key = key_map.get(kind, "")
-        return list(self.game.cosmetics.get(key, []))
+        return self.game.cosmetics.get(key, ())
 
     def _tab_costs(self) -> Dict[str, Dict[str, int]]:
         return {
@@ -6593,6 +7159,7 @@ class CosmeticsShopScene(Scene):
         self.active_tab = tab_key
         self.selected_index = 0
         self._refresh_items()
+        self._layout_dirty = True
 
     def _switch_tab_by_delta(self, delta: int) -> None:
         """Cycle tabs left/right (e.g., LB/RB on controllers)."""
@@ -6608,8 +7175,12 @@ class CosmeticsShopScene(Scene):
         self.game.sound.play_event("menu_move")
 
     def _status(self, kind: str, name: str, cost: int) -> str:
-        owned = name in self._owned(kind)
-        selected = self.game.cosmetics.get(kind, "None") == name
+        if kind == self.active_tab:
+            owned = name in self._owned_set
+            selected = self._selected_name == name
+        else:
+            owned = name in self._owned(kind)
+            selected = self.game.cosmetics.get(kind, "None") == name
         if selected:
             return "Selected"
         elif owned or cost == 0:
@@ -6619,6 +7190,9 @@ class CosmeticsShopScene(Scene):
     def _refresh_items(self) -> None:
         costs = self._tab_costs().get(self.active_tab, {})
         self.items = [(name, cost) for name, cost in costs.items()]
+        # Snapshot ownership for the active tab; refreshed on tab switch and purchase
+        self._owned_set = frozenset(self._owned(self.active_tab))
+        self._selected_name = self.game.cosmetics.get(self.active_tab, "None")
         if self.selected_index >= len(self.items):
             self.selected_index = max(0, len(self.items) - 1)
         self.scroll_row = 0
@@ -6636,58 +7210,52 @@ class CosmeticsShopScene(Scene):
             self.scroll_row = row - visible_rows + 1
         self._clamp_scroll()
 
+    # Three full tabs at one grid size fit comfortably
+    _ITEM_CACHE_SIZE = 64
+
     def _item_surface(self, kind: str, name: str, size: Tuple[int, int]) -> Optional[pygame.Surface]:
         key = (kind, name, size)
-        cached = self._item_cache.get(key)
-        if cached is not None:
+        cache = self._item_cache
+        if key in cache:
+            # Re-insert so the dict's order doubles as least-recently-used first;
+            # previews that failed to load are cached as None too
+            cached = cache[key] = cache.pop(key)
+            return cached
+        if len(cache) >= self._ITEM_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        if name == "None":
+            # Every tab shares the same red-cross placeholder
+            cached = cache[key] = _none_placeholder(size)
             return cached
         surface: Optional[pygame.Surface] = None
         if kind == "outfit":
-            if name == "None":
-                surface = pygame.Surface(size, pygame.SRCALPHA)
-                line_width = max(6, min(size) // 10)
-                pad = max(10, min(size) // 6)
-                pygame.draw.line(surface, (220, 60, 60, 255), (pad, pad), (size[0] - pad, size[1] - pad), line_width)
-                pygame.draw.line(surface, (220, 60, 60, 255), (size[0] - pad, pad), (pad, size[1] - pad), line_width)
-            else:
-                base_dir = ASSET_DIR / "outfits" / name
-                if base_dir.exists():
-                    png_path = base_dir / "idle_0.png"
-                    if not png_path.exists():
-                        options = sorted(base_dir.glob("*.png"))
-                        png_path = options[0] if options else png_path
-                    if png_path.exists():
-                        try:
-                            surface = pygame.image.load(str(png_path)).convert_alpha()
-                        except Exception as exc:
-                            print(f"[Assets] Failed to load outfit preview {png_path}: {exc}")
-        elif kind == "hat":
-            if name == "None":
-                surface = pygame.Surface(size, pygame.SRCALPHA)
-                line_width = max(6, min(size) // 10)
-                pad = max(10, min(size) // 6)
-                pygame.draw.line(surface, (220, 60, 60, 255), (pad, pad), (size[0] - pad, size[1] - pad), line_width)
-                pygame.draw.line(surface, (220, 60, 60, 255), (size[0] - pad, pad), (pad, size[1] - pad), line_width)
-            else:
-                png_path = HAT_DIR / f"{name}.png"
+            base_dir = ASSET_DIR / "outfits" / name
+            if base_dir.exists():
+                png_path = base_dir / "idle_0.png"
+                if not png_path.exists():
+                    options = sorted(base_dir.glob("*.png"))
+                    png_path = options[0] if options else png_path
                 if png_path.exists():
                     try:
                         surface = pygame.image.load(str(png_path)).convert_alpha()
                     except Exception as exc:
-                        print(f"[Assets] Failed to load hat preview {png_path}: {exc}")
+                        print(f"[Assets] Failed to load outfit preview {png_path}: {exc}")
+        elif kind == "hat":
+            png_path = HAT_DIR / f"{name}.png"
+            if png_path.exists():
+                try:
+                    surface = pygame.image.load(str(png_path)).convert_alpha()
+                except Exception as exc:
+                    print(f"[Assets] Failed to load hat preview {png_path}: {exc}")
         elif kind == "trail":
-            if name == "None":
-                surface = pygame.Surface(size, pygame.SRCALPHA)
-                line_width = max(6, min(size) // 10)
-                pad = max(10, min(size) // 6)
-                pygame.draw.line(surface, (220, 60, 60, 255), (pad, pad), (size[0] - pad, size[1] - pad), line_width)
-                pygame.draw.line(surface, (220, 60, 60, 255), (size[0] - pad, pad), (pad, size[1] - pad), line_width)
-            else:
-                surface = self.game.assets.trail_texture(name, size)
+            surface = self.game.assets.trail_texture(name, size)
 
         if surface is not None and surface.get_size() != size:
             surface = pygame.transform.smoothscale(surface, size)
-        self._item_cache[key] = surface
+        if surface is not None and pygame.display.get_surface() is not None:
+            # Scaled previews are drawn every frame; match the display format once here
+            surface = surface.convert_alpha()
+        cache[key] = surface
         return surface
 
     def _buy_or_select(self, kind: str, name: str, cost: int) -> None:
@@ -6723,6 +7291,7 @@ class CosmeticsShopScene(Scene):
             coins=coins,
             skills=self.game.skills,
             cosmetics=self.game.cosmetics,
+            defer=True,
         )
         self._apply_live_cosmetics()
         self._refresh_items()
@@ -6800,21 +7369,18 @@ class CosmeticsShopScene(Scene):
                     self._buy_or_select(self.active_tab, name, cost)
                 self._ensure_selected_visible()
             elif event.type == pygame.MOUSEMOTION and self._item_rects:
-                for idx, rect in enumerate(self._item_rects):
-                    if rect.collidepoint(event.pos):
-                        if idx != self.selected_index:
-                            self.selected_index = idx
-                            self.game.sound.play_event("menu_move")
-                            self._ensure_selected_visible()
-                        break
+                idx = self._item_at(event.pos)
+                if idx is not None and idx != self.selected_index:
+                    self.selected_index = idx
+                    self.game.sound.play_event("menu_move")
+                    self._ensure_selected_visible()
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self._item_rects:
-                for idx, rect in enumerate(self._item_rects):
-                    if rect.collidepoint(event.pos):
-                        self.selected_index = idx
-                        name, cost = self.items[idx]
-                        self._buy_or_select(self.active_tab, name, cost)
-                        self._ensure_selected_visible()
-                        break
+                idx = self._item_at(event.pos)
+                if idx is not None:
+                    self.selected_index = idx
+                    name, cost = self.items[idx]
+                    self._buy_or_select(self.active_tab, name, cost)
+                    self._ensure_selected_visible()
             elif event.type == pygame.JOYHATMOTION:
                 hx, hy = event.value
                 moved = False
@@ -6865,47 +7431,44 @@ class CosmeticsShopScene(Scene):
                     self.scroll_row = max(0, self.scroll_row - event.y)
                     self._clamp_scroll()
 
-    def update(self, dt: float) -> None:
-        pass
+    def _item_at(self, pos: Tuple[int, int]) -> Optional[int]:
+        # The grid is evenly spaced, so the cell under the cursor can be
+        # computed instead of scanning every item rect
+        if self._grid_layout is None:
+            return None
+        x0, y0, item_w, item_h, gap, cols = self._grid_layout
+        col, dx = divmod(pos[0] - x0, item_w + gap)
+        row, dy = divmod(pos[1] - y0, item_h + gap)
+        if col < 0 or row < 0 or col >= cols or dx >= item_w or dy >= item_h:
+            return None
+        idx = row * cols + col
+        return idx if idx < len(self._item_rects) else None
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.fill((12, 12, 28))
-        if self.game.settings["glitch_fx"]:
-            _draw_glitch_overlay(surface)
-        title_font = self.game.assets.font(48, True)
-        draw_glitch_text(surface, title_font, "COSMETICS SHOP", 70, WHITE, self.game.settings["glitch_fx"])
-        info_font = self.game.assets.font(24, False)
-        coins = getattr(self.game.progress, "coins", 0)
-        draw_center_text(surface, info_font, f"Coins: {coins}", 130, (255, 223, 70))
-        tab_font = self.game.assets.font(22, True)
-        self._tab_rects = []
+    def _rebuild_layout(self) -> None:
+        """Lay out the tab row and item grid; only the item count can change it."""
+        self._layout_dirty = False
         tab_width = 180
         tab_height = 40
         tab_gap = 16
         total_width = tab_width * len(self.tabs) + tab_gap * (len(self.tabs) - 1)
         start_x = (SCREEN_WIDTH - total_width) // 2
         tab_y = 170
-        for idx, (key, label) in enumerate(self.tabs):
-            x = start_x + idx * (tab_width + tab_gap)
-            rect = pygame.Rect(x, tab_y, tab_width, tab_height)
-            self._tab_rects.append(rect)
-            is_active = key == self.active_tab
-            base_color = (40, 50, 80) if not is_active else (90, 120, 200)
-            border_color = (120, 140, 200) if not is_active else (220, 240, 255)
-            pygame.draw.rect(surface, base_color, rect, border_radius=10)
-            pygame.draw.rect(surface, border_color, rect, 2, border_radius=10)
-            tab_render = tab_font.render(label, True, WHITE)
-            tab_rect = tab_render.get_rect(center=rect.center)
-            surface.blit(tab_render, tab_rect)
-        current = self.game.assets.font(20, False)
-        current_text = (
-            f"Outfit: {self.game.cosmetics.get('outfit', 'None')}  |  "
-            f"Hat: {self.game.cosmetics.get('hat', 'None')}  |  "
-            f"Trail: {self.game.cosmetics.get('trail', 'None')}"
-        )
-        draw_center_text(surface, current, current_text, 230, (200, 220, 255))
+        self._tab_rects = [
+            pygame.Rect(start_x + idx * (tab_width + tab_gap), tab_y, tab_width, tab_height)
+            for idx in range(len(self.tabs))
+        ]
+        # Box chrome keyed by active/selected; draw.rect leaves the rounded
+        # corners untouched, and so do these boxes' fully transparent corners
+        self._tab_boxes = {
+            False: _rounded_box((tab_width, tab_height), (40, 50, 80), (120, 140, 200), 10),
+            True: _rounded_box((tab_width, tab_height), (90, 120, 200), (220, 240, 255), 10),
+        }
+        tab_font = self.game.assets.font(22, True)
+        self._tab_label_blits = []
+        for (_, label), rect in zip(self.tabs, self._tab_rects):
+            tab_render = _render_text_cached(tab_font, label, WHITE)
+            self._tab_label_blits.append((tab_render, tab_render.get_rect(center=rect.center).topleft))
         # Items grid below the tab row
-        self._item_rects = []
         grid_top = 270
         grid_width = SCREEN_WIDTH - 240
         grid_height = SCREEN_HEIGHT - 140 - grid_top
@@ -6921,36 +7484,100 @@ class CosmeticsShopScene(Scene):
         self._grid_cols = cols
         self._grid_rows = rows
         self._visible_rows = rows
-        self.scroll_row = 0
         total_row_width = cols * item_width + (cols - 1) * gap
         start_x = (SCREEN_WIDTH - total_row_width) // 2
-        name_font = self.game.assets.font(18, True)
-        status_font = self.game.assets.font(16, False)
+        self._grid_layout = (start_x, grid_top, item_width, item_height, gap, cols)
         image_dim = max(64, min(item_width, item_height) - 70)
-        image_size = (image_dim, image_dim)
-        for idx, (name, cost) in enumerate(self.items):
-            col = idx % cols
-            row = idx // cols
-            x = start_x + col * (item_width + gap)
-            y = grid_top + row * (item_height + gap)
-            rect = pygame.Rect(x, y, item_width, item_height)
+        self._image_size = (image_dim, image_dim)
+        self._item_boxes = {
+            False: _rounded_box((item_width, item_height), (28, 32, 54), (80, 90, 130), 14),
+            True: _rounded_box((item_width, item_height), (60, 80, 140), (220, 230, 255), 14),
+        }
+        self._item_rects = []
+        name_font = self.game.assets.font(18, True)
+        self._name_blits = []
+        self._preview_positions = []
+        self._status_positions = []
+        self._status_blits.clear()
+        for idx, (name, _) in enumerate(self.items):
+            row, col = divmod(idx, cols)
+            rect = pygame.Rect(
+                start_x + col * (item_width + gap), grid_top + row * (item_height + gap), item_width, item_height
+            )
             self._item_rects.append(rect)
-            selected = idx == self.selected_index
-            box_color = (28, 32, 54) if not selected else (60, 80, 140)
-            border = (80, 90, 130) if not selected else (220, 230, 255)
-            pygame.draw.rect(surface, box_color, rect, border_radius=14)
-            pygame.draw.rect(surface, border, rect, 2, border_radius=14)
-            name_render = name_font.render(name, True, WHITE)
-            name_rect = name_render.get_rect(center=(rect.centerx, rect.top + 24))
-            surface.blit(name_render, name_rect)
+            name_render = _render_text_cached(name_font, name, WHITE)
+            self._name_blits.append((name_render, name_render.get_rect(center=(rect.centerx, rect.top + 24)).topleft))
+            self._preview_positions.append((rect.centerx, rect.centery - 6))
+            self._status_positions.append((rect.centerx, rect.bottom - 26))
+
+    def update(self, dt: float) -> None:
+        pass
+
+    def frame_key(self):
+        if self.game.settings["glitch_fx"]:
+            return None
+        cosmetics = self.game.cosmetics
+        return (
+            self.game.progress.coins,
+            self.active_tab,
+            self.selected_index,
+            self._owned_set,
+            cosmetics.get("outfit", "None"),
+            cosmetics.get("hat", "None"),
+            cosmetics.get("trail", "None"),
+        )
+
+    def draw(self, surface: pygame.Surface) -> None:
+        surface.fill((12, 12, 28))
+        if self.game.settings["glitch_fx"]:
+            _draw_glitch_overlay(surface)
+        title_font = self.game.assets.font(48, True)
+        if self.game.settings["glitch_fx"]:
+            draw_glitch_text(surface, title_font, "COSMETICS SHOP", 70, WHITE, True)
+        else:
+            _draw_center_text_cached(surface, title_font, "COSMETICS SHOP", 70, WHITE)
+        info_font = self.game.assets.font(24, False)
+        coins = self.game.progress.coins
+        if coins != self._coin_line[0]:
+            self._coin_line = (coins, _center_text_blits(surface.get_width(), info_font, f"Coins: {coins}", 130, (255, 223, 70)))
+        # The coin and loadout lines sit clear of the tab and item boxes, and the
+        # labels and previews sit inside their own box, so everything after the
+        # title goes out in one blits() once the boxes are drawn
+        width = surface.get_width()
+        blit_seq = list(self._coin_line[1])
+        if self._layout_dirty:
+            self._rebuild_layout()
+        tab_boxes = self._tab_boxes
+        for (key, _), rect in zip(self.tabs, self._tab_rects):
+            surface.blit(tab_boxes[key == self.active_tab], rect)
+        blit_seq += self._tab_label_blits
+        current = self.game.assets.font(20, False)
+        current_text = (
+            f"Outfit: {self.game.cosmetics.get('outfit', 'None')}  |  "
+            f"Hat: {self.game.cosmetics.get('hat', 'None')}  |  "
+            f"Trail: {self.game.cosmetics.get('trail', 'None')}"
+        )
+        blit_seq += _center_text_blits(width, current, current_text, 230, (200, 220, 255))
+        self.scroll_row = 0
+        status_font = self.game.assets.font(16, False)
+        status_blits = self._status_blits
+        image_size = self._image_size
+        item_boxes = self._item_boxes
+        for idx, ((name, cost), rect, name_blit, preview_pos, status_pos) in enumerate(
+            zip(self.items, self._item_rects, self._name_blits, self._preview_positions, self._status_positions)
+        ):
+            surface.blit(item_boxes[idx == self.selected_index], rect)
+            blit_seq.append(name_blit)
             preview = self._item_surface(self.active_tab, name, image_size)
             if preview is not None:
-                preview_rect = preview.get_rect(center=(rect.centerx, rect.centery - 6))
-                surface.blit(preview, preview_rect)
+                blit_seq.append((preview, preview.get_rect(center=preview_pos)))
             status = self._status(self.active_tab, name, cost)
-            status_render = status_font.render(status, True, (200, 220, 255))
-            status_rect = status_render.get_rect(center=(rect.centerx, rect.bottom - 26))
-            surface.blit(status_render, status_rect)
+            status_blit = status_blits.get((idx, status))
+            if status_blit is None:
+                status_render = _render_text_cached(status_font, status, (200, 220, 255))
+                status_blit = status_blits[(idx, status)] = (status_render, status_render.get_rect(center=status_pos).topleft)
+            blit_seq.append(status_blit)
+        surface.blits(blit_seq, doreturn=False)
 
 
 class SkillsShopScene(Scene):
@@ -6968,16 +7595,30 @@ class SkillsShopScene(Scene):
             "stagger": 7,
             "extra_health": 5,  # per level
         }
+        # (coins, placed "Coins: N" blits) for the last count drawn
+        self._coin_line: Tuple[int, Tuple[Tuple[pygame.Surface, Tuple[int, int]], ...]] = (-1, ())
         self._rebuild_menu()
 
     def _rebuild_menu(self) -> None:
+        # Labels only change on purchase, which rebuilds the menu, so format them once here
+        self._labels = {
+            key: self._label(name, key)
+            for name, key in (
+                ("Rapid Charge", "rapid_charge"),
+                ("Blast Radius", "blast_radius"),
+                ("Shield Pulse", "shield_pulse"),
+                ("Reflective Shield", "reflective_shield"),
+                ("Stagger", "stagger"),
+            )
+        }
+        self._labels["extra_health"] = self._extra_health_label()
         entries = [
-            MenuEntry(lambda: self._label("Rapid Charge", "rapid_charge"), lambda: self._buy_skill("rapid_charge")),
-            MenuEntry(lambda: self._label("Blast Radius", "blast_radius"), lambda: self._buy_skill("blast_radius")),
-            MenuEntry(lambda: self._label("Shield Pulse", "shield_pulse"), lambda: self._buy_skill("shield_pulse")),
-            MenuEntry(lambda: self._label("Reflective Shield", "reflective_shield"), lambda: self._buy_skill("reflective_shield")),
-            MenuEntry(lambda: self._label("Stagger", "stagger"), lambda: self._buy_skill("stagger")),
-            MenuEntry(self._extra_health_label, self._buy_extra_health),
+            MenuEntry(lambda: self._labels["rapid_charge"], lambda: self._buy_skill("rapid_charge")),
+            MenuEntry(lambda: self._labels["blast_radius"], lambda: self._buy_skill("blast_radius")),
+            MenuEntry(lambda: self._labels["shield_pulse"], lambda: self._buy_skill("shield_pulse")),
+            MenuEntry(lambda: self._labels["reflective_shield"], lambda: self._buy_skill("reflective_shield")),
+            MenuEntry(lambda: self._labels["stagger"], lambda: self._buy_skill("stagger")),
+            MenuEntry(lambda: self._labels["extra_health"], self._buy_extra_health),
             MenuEntry(lambda: "Back", lambda: "exit"),
         ]
         self.menu = VerticalMenu(entries, sound=self.game.sound)
@@ -7029,16 +7670,27 @@ class SkillsShopScene(Scene):
     def update(self, dt: float) -> None:
         pass
 
+    def frame_key(self):
+        if self.game.settings["glitch_fx"]:
+            return None
+        labels = tuple(entry.label() for entry in self.menu.entries)
+        return (self.game.progress.coins, self.menu.selected, labels)
+
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((10, 10, 24))
         if self.game.settings["glitch_fx"]:
             _draw_glitch_overlay(surface)
         title_font = self.game.assets.font(48, True)
-        draw_glitch_text(surface, title_font, "SKILLS SHOP", 140, WHITE, self.game.settings["glitch_fx"])
+        if self.game.settings["glitch_fx"]:
+            draw_glitch_text(surface, title_font, "SKILLS SHOP", 140, WHITE, True)
+        else:
+            _draw_center_text_cached(surface, title_font, "SKILLS SHOP", 140, WHITE)
         info_font = self.game.assets.font(22, False)
-        coins = getattr(self.game.progress, "coins", 0)
-        draw_center_text(surface, info_font, f"Coins: {coins}", 200, (255, 223, 70))
-        draw_center_text(surface, info_font, "Select a skill to purchase. Purchased skills stay active.", 230, (200, 200, 230))
+        coins = self.game.progress.coins
+        if coins != self._coin_line[0]:
+            self._coin_line = (coins, _center_text_blits(surface.get_width(), info_font, f"Coins: {coins}", 200, (255, 223, 70)))
+        surface.blits(self._coin_line[1], doreturn=False)
+        _draw_center_text_cached(surface, info_font, "Select a skill to purchase. Purchased skills stay active.", 230, (200, 200, 230))
         # Position menu a bit lower under the instruction text
         self.menu.draw(surface, self.game.assets, 320, self.game.settings["glitch_fx"])
 
@@ -7052,7 +7704,7 @@ class SkillsShopScene(Scene):
         coins -= cost
         self.game.skills[key] = True
         self.game.progress.coins = coins
-        self.game.progress.save(self.game.progress.world, self.game.progress.level, getattr(self.game, "player_color", None), coins=coins, skills=self.game.skills, cosmetics=self.game.cosmetics)
+        self.game.progress.save(self.game.progress.world, self.game.progress.level, getattr(self.game, "player_color", None), coins=coins, skills=self.game.skills, cosmetics=self.game.cosmetics, defer=True)
         self._rebuild_menu()
         self.game.sound.play_event("menu_confirm")
 
@@ -7075,7 +7727,7 @@ class SkillsShopScene(Scene):
             except Exception:
                 pass
         self.game.progress.coins = coins
-        self.game.progress.save(self.game.progress.world, self.game.progress.level, getattr(self.game, "player_color", None), coins=coins, skills=self.game.skills, cosmetics=self.game.cosmetics)
+        self.game.progress.save(self.game.progress.world, self.game.progress.level, getattr(self.game, "player_color", None), coins=coins, skills=self.game.skills, cosmetics=self.game.cosmetics, defer=True)
         self._rebuild_menu()
         self.game.sound.play_event("menu_confirm")
 
@@ -7140,6 +7792,11 @@ class ShopsHubScene(Scene):
     def update(self, dt: float) -> None:
         pass
 
+    def frame_key(self):
+        if self.game.settings["glitch_fx"]:
+            return None
+        return self.menu.selected
+
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((12, 12, 26))
         if self.game.settings["glitch_fx"]:
@@ -8998,6 +9655,9 @@ class Game:
 
         pygame.display.set_caption(TITLE)
         self.clock = pygame.time.Clock()
+        # Scene and frame_key() of the last presented frame, so static menus can skip redraws
+        self._presented_scene: Optional[Scene] = None
+        self._presented_key: Any = None
         self.assets = AssetCache()
         self.level_generator = LevelGenerator(self.assets)
         self.gamepads: List[pygame.joystick.Joystick] = []
@@ -9020,7 +9680,7 @@ class Game:
         self._last_music = None
         self._prev_controller_state = InputState()
         self.last_input_device: str = "keyboard"
-        self._suppress_accept_until = 0.0
+        self._suppress_accept_until_ms = 0
         self._pause_menu_ignore_back_once = False
         self.music_override = None
 
@@ -9069,6 +9729,8 @@ class Game:
         return HAT_COLORS.get(hat, None)
 
     def change_scene(self, scene_cls: Callable[..., Scene], *args, **kwargs) -> None:
+        # Leaving a shop must not leave a purchase unwritten for the next scene to reload over
+        self.progress.flush()
         self.scene.on_exit()
         # If scene_cls is a lambda or callable, call it to get the scene instance
         if callable(scene_cls) and not isinstance(scene_cls, type):
@@ -9272,7 +9934,8 @@ class Game:
             dt = self.clock.tick(FPS) / 1000.0
             self._poll_controller()
             re_poll = False
-            for event in pygame.event.get():
+            events = pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.quit()
                     break
@@ -9282,7 +9945,7 @@ class Game:
                     continue
                 if event.type in (pygame.KEYDOWN, pygame.JOYBUTTONDOWN):
                     # Suppress accept/back inputs right after scene changes
-                    if getattr(self, "_suppress_accept_until", 0.0) > time.time():
+                    if getattr(self, "_suppress_accept_until_ms", 0) > pygame.time.get_ticks():
                         continue
                 if event.type in (pygame.KEYDOWN, pygame.KEYUP):
                     self.last_input_device = "keyboard"
@@ -9300,9 +9963,17 @@ class Game:
             if re_poll:
                 self._poll_controller()
             self.scene.update(dt)
-            self.scene.draw(self.screen)
-            pygame.display.flip()
-
+            # Events may have drawn straight to the screen (popups, mode changes),
+            # so only an idle frame with an unchanged frame_key can be skipped
+            key = self.scene.frame_key()
+            if key is None or events or self.scene is not self._presented_scene or key != self._presented_key:
+                self.scene.draw(self.screen)
+                pygame.display.flip()
+                self._presented_scene = self.scene
+                self._presented_key = key
+            self.progress.flush(0.5)
+
+        self.progress.flush()
         pygame.quit()
         sys.exit()
 